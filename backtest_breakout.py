@@ -10,15 +10,39 @@ Breakout Strategy Backtest
 import argparse
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime, timedelta
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 
+def _rolling_hl_np(high, low, period):
+    """
+    Rolling max of high and min of low over plain arrays
+
+    Returns (high_band, low_band) float64 arrays; the first period-1
+    entries are NaN.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+
+    high_band = np.full(len(high), np.nan)
+    low_band = np.full(len(low), np.nan)
+    if len(high) >= period:
+        # Zero-copy windows reduced along the last axis
+        high_band[period - 1:] = sliding_window_view(high, period).max(axis=-1)
+        low_band[period - 1:] = sliding_window_view(low, period).min(axis=-1)
+
+    return high_band, low_band
+
+
 def calculate_rolling_high_low(df, period=20):
     """Calculate rolling high and low bands"""
-    df['high_band'] = df['high'].rolling(window=period).max()
-    df['low_band'] = df['low'].rolling(window=period).min()
+    df['high_band'], df['low_band'] = _rolling_hl_np(
+        df['high'].to_numpy(dtype=np.float64),
+        df['low'].to_numpy(dtype=np.float64),
+        period
+    )
     return df
 
 
@@ -26,7 +26,7 @@ def calculate_rsi(prices, period=14):
         return np.full(len(prices), 100.0)
 
     rs = up / down
-    rsi = np.zeros_like(prices)
+    rsi = np.empty(len(prices), dtype=np.float64)
     rsi[:period] = 100. - 100. / (1. + rs)
 
     for i in range(period, len(prices)):
@@ -8,6 +8,7 @@ Stochastic Oscillator Strategy Backtest
 """
 
 import argparse
+from collections import deque
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -15,22 +16,57 @@ import psycopg2
 
 
 def calculate_stochastic(high, low, close, k_period=14, d_period=3):
-    """Calculate Stochastic Oscillator %K and %D"""
-    # Calculate %K
-    lowest_low = pd.Series(low).rolling(window=k_period).min().values
-    highest_high = pd.Series(high).rolling(window=k_period).max().values
-
-    k_values = np.zeros(len(close))
-    for i in range(len(close)):
-        if not np.isnan(lowest_low[i]) and not np.isnan(highest_high[i]):
-            denom = highest_high[i] - lowest_low[i]
-            if denom != 0:
-                k_values[i] = ((close[i] - lowest_low[i]) / denom) * 100
-            else:
-                k_values[i] = 50  # Default to middle
-
-    # Calculate %D (simple moving average of %K)
-    d_values = pd.Series(k_values).rolling(window=d_period).mean().values
+    """
+    Calculate Stochastic Oscillator %K and %D
+
+    Rolling highs/lows are tracked with monotonic index deques, so the
+    whole pass is O(n) instead of rescanning each k_period window.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+
+    # Calculate %K (zero until the first full window)
+    k_values = np.empty(n)
+    k_values[:k_period - 1] = 0
+    max_idx = deque()  # Indices of window highs, values decreasing
+    min_idx = deque()  # Indices of window lows, values increasing
+    for i in range(n):
+        while max_idx and high[max_idx[-1]] <= high[i]:
+            max_idx.pop()
+        max_idx.append(i)
+        while min_idx and low[min_idx[-1]] >= low[i]:
+            min_idx.pop()
+        min_idx.append(i)
+
+        # Drop the index that just left the window
+        if max_idx[0] <= i - k_period:
+            max_idx.popleft()
+        if min_idx[0] <= i - k_period:
+            min_idx.popleft()
+
+        if i < k_period - 1:
+            continue
+
+        highest_high = high[max_idx[0]]
+        lowest_low = low[min_idx[0]]
+        denom = highest_high - lowest_low
+        if denom != 0:
+            k_values[i] = ((close[i] - lowest_low) / denom) * 100
+        else:
+            k_values[i] = 50  # Default to middle
+
+    # Calculate %D (simple moving average of %K) with a running sum
+    d_values = np.empty(n)
+    d_values[:d_period - 1] = np.nan
+    total = 0.0
+    for i in range(n):
+        total += k_values[i]
+        if i >= d_period:
+            total -= k_values[i - d_period]
+        if i >= d_period - 1:
+            d_values[i] = total / d_period
 
     return k_values, d_values
 
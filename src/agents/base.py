@@ -9,7 +9,7 @@ from abc import ABC, abstractmethod
 from typing import Type, AsyncIterator
 from datetime import datetime
 
-from src.core.event_bus import EventBus, consume_events
+from src.core.event_bus import EventBus, FastQueue, consume_events, consume_event_batches
 from src.models.events import (
     Event,
     AgentStartedEvent,
@@ -55,7 +55,9 @@ class BaseAgent(ABC):
         Start the agent
 
         Must be implemented by subclasses.
-        This is where the agent's main logic runs.
+        This is where the agent's main logic runs. Launch agents through
+        run(), which sets the running flag; the event consumers stop at
+        the first event when start() is called on its own.
         """
         pass
 
@@ -166,7 +168,7 @@ class BaseAgent(ABC):
         except Exception as e:
             self.logger.error(f"Failed to publish event: {e}")
 
-    def subscribe(self, event_type: Type[Event]) -> asyncio.Queue:
+    def subscribe(self, event_type: Type[Event]) -> FastQueue:
         """
         Subscribe to events of a specific type
 
@@ -178,7 +180,7 @@ class BaseAgent(ABC):
         """
         return self.event_bus.subscribe(event_type)
 
-    async def _consume_events(self, queue: asyncio.Queue) -> AsyncIterator[Event]:
+    async def _consume_events(self, queue: FastQueue) -> AsyncIterator[Event]:
         """
         Consume events from a queue
 
@@ -193,6 +195,21 @@ class BaseAgent(ABC):
                 break
             yield event
 
+    async def _consume_batches(self, queue: FastQueue) -> AsyncIterator[list[Event]]:
+        """
+        Consume events from a queue in batches
+
+        Args:
+            queue: Queue to consume from
+
+        Yields:
+            Lists of events that were waiting in the queue
+        """
+        async for batch in consume_event_batches(queue):
+            if not self._running:
+                break
+            yield batch
+
     # ========================================================================
     # Status & Health
     # ========================================================================
@@ -278,7 +295,7 @@ class EventDrivenAgent(BaseAgent):
 
     def __init__(self, name: str, event_bus: EventBus):
         super().__init__(name, event_bus)
-        self._event_subscriptions: list[tuple[Type[Event], asyncio.Queue]] = []
+        self._event_subscriptions: list[tuple[Type[Event], FastQueue]] = []
 
     def add_subscription(self, event_type: Type[Event]) -> None:
         """
@@ -317,7 +334,7 @@ class EventDrivenAgent(BaseAgent):
         # Run all tasks concurrently
         await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _process_queue(self, queue: asyncio.Queue) -> None:
+    async def _process_queue(self, queue: FastQueue) -> None:
         """Process events from a specific queue"""
         async for event in self._consume_events(queue):
             try:
@@ -48,6 +48,11 @@ class TradeExecutionAgent(BaseAgent):
         self.current_allocations: Dict[str, float] = {}  # strategy_name -> allocation_pct
         self.current_prices: Dict[str, Decimal] = {}  # symbol -> last price
 
+        # Subscribe to signals, allocations, and market data
+        self._signal_queue = self.event_bus.subscribe(TradingSignalEvent)
+        self._allocation_queue = self.event_bus.subscribe(AllocationEvent)
+        self._market_queue = self.event_bus.subscribe(MarketTickEvent)
+
         # Trading mode configuration
         self.trade_mode = self.config.get('trading', {}).get('mode', 'paper')
 
@@ -69,16 +74,11 @@ class TradeExecutionAgent(BaseAgent):
         """Start execution agent"""
         self.logger.info(f"Starting trade execution with ${self.initial_capital} capital")
 
-        # Subscribe to signals, allocations, and market data
-        signal_queue = self.event_bus.subscribe(TradingSignalEvent)
-        allocation_queue = self.event_bus.subscribe(AllocationEvent)
-        market_queue = self.event_bus.subscribe(MarketTickEvent)
-
         # Run event loops concurrently
         await asyncio.gather(
-            self._process_signals(signal_queue),
-            self._process_allocations(allocation_queue),
-            self._track_prices(market_queue),
+            self._process_signals(self._signal_queue),
+            self._process_allocations(self._allocation_queue),
+            self._track_prices(self._market_queue),
             self._performance_tracking_loop()
         )
 
@@ -56,18 +56,18 @@ class ForkManagerAgent(BaseAgent):
         self.cleanup_interval = cleanup_interval_seconds
         self.active_forks: Dict[str, dict] = {}  # fork_id -> metadata
 
+        # Subscribe to fork requests and completions
+        self._request_queue = self.event_bus.subscribe(ForkRequestEvent)
+        self._completed_queue = self.event_bus.subscribe(ForkCompletedEvent)
+
     async def start(self):
         """Start fork manager"""
         logger.info(f"Starting Fork Manager for parent service {self.parent_service_id}")
 
-        # Subscribe to fork requests and completions
-        request_queue = self.event_bus.subscribe(ForkRequestEvent)
-        completed_queue = self.event_bus.subscribe(ForkCompletedEvent)
-
         # Run event loops concurrently
         await asyncio.gather(
-            self._process_fork_requests(request_queue),
-            self._process_fork_completions(completed_queue),
+            self._process_fork_requests(self._request_queue),
+            self._process_fork_completions(self._completed_queue),
             self._cleanup_expired_forks()
         )
 
@@ -5,6 +5,7 @@ Enforces risk limits and can halt trading if thresholds breached.
 """
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import Dict, Optional
@@ -14,7 +15,8 @@ from src.models.events import (
     TradeExecutedEvent,
     RiskAlertEvent,
     EmergencyHaltEvent,
-    MarketTickEvent
+    MarketTickEvent,
+    _ZERO
 )
 from src.core.database import get_db_manager
 
@@ -79,9 +81,27 @@ class RiskMonitorAgent(BaseAgent):
         self.current_prices: Dict[str, Decimal] = {}
         self.strategy_peak_values: Dict[str, Decimal] = {}
 
+        # Memoized portfolio value: dropped on every trade, adjusted in
+        # place on price ticks using the cached position quantities, and
+        # expired after a TTL because the underlying query uses rolling
+        # time windows
+        self.portfolio_value_ttl_seconds = float(config.get('portfolio_value_ttl_seconds', 30.0))
+        self._pv_cache: Optional[Decimal] = None
+        self._pv_quantities: Dict[str, Decimal] = {}  # symbol -> quantity
+        self._pv_expires_at = 0.0  # monotonic
+        self._pv_generation = 0  # bumped on invalidation
+
         # Alert thresholds (warn at 80% of limit)
         self.warning_threshold = Decimal('0.8')
 
+        # Identical alerts within this window are coalesced into one
+        self.alert_cooldown_seconds = float(config.get('alert_cooldown_seconds', 5.0))
+        self._alert_cache: Dict[tuple, float] = {}  # alert key -> last published (monotonic)
+
+        # Subscribe to events
+        self._trade_queue = self.event_bus.subscribe(TradeExecutedEvent)
+        self._market_queue = self.event_bus.subscribe(MarketTickEvent)
+
     async def start(self):
         """Start risk monitor"""
         logger.info("Starting Risk Monitor Agent")
@@ -92,20 +112,17 @@ class RiskMonitorAgent(BaseAgent):
         # Initialize daily start value
         await self._initialize_daily_tracking()
 
-        # Subscribe to events
-        trade_queue = self.event_bus.subscribe(TradeExecutedEvent)
-        market_queue = self.event_bus.subscribe(MarketTickEvent)
-
         # Run monitoring loops
         await asyncio.gather(
-            self._monitor_trades(trade_queue),
-            self._track_prices(market_queue),
+            self._monitor_trades(self._trade_queue),
+            self._track_prices(self._market_queue),
             self._periodic_checks()
         )
 
     async def _initialize_daily_tracking(self):
         """Initialize daily portfolio value tracking"""
         self.daily_start_time = datetime.now()
+        self._invalidate_portfolio_value()
         self.daily_start_value = await self._get_current_portfolio_value()
 
         if self.daily_start_value is None:
@@ -127,7 +144,7 @@ class RiskMonitorAgent(BaseAgent):
         """Track current market prices"""
         async for tick in self._consume_events(queue):
             try:
-                self.current_prices[tick.symbol] = tick.price
+                self._update_price(tick.symbol, tick.price)
             except Exception as e:
                 logger.error(f"Error tracking price: {e}", exc_info=True)
 
@@ -138,6 +155,9 @@ class RiskMonitorAgent(BaseAgent):
         Args:
             trade: Trade execution event
         """
+        # The trade changed cash and positions
+        self._invalidate_portfolio_value()
+
         if self.halt_active:
             logger.warning(
                 f"Trade executed during halt: {trade.strategy_name} "
@@ -168,7 +188,7 @@ class RiskMonitorAgent(BaseAgent):
 
         # Check if exceeds limit
         if position_size_pct > self.max_position_size_pct:
-            await self.publish(RiskAlertEvent(
+            await self._publish_alert(RiskAlertEvent(
                 alert_type='position_size',
                 severity='critical',
                 message=f"Position size {position_size_pct:.2f}% exceeds limit "
@@ -187,7 +207,7 @@ class RiskMonitorAgent(BaseAgent):
 
         # Warning threshold
         elif position_size_pct > self.max_position_size_pct * self.warning_threshold:
-            await self.publish(RiskAlertEvent(
+            await self._publish_alert(RiskAlertEvent(
                 alert_type='position_size',
                 severity='warning',
                 message=f"Position size {position_size_pct:.2f}% approaching limit "
@@ -201,7 +221,7 @@ class RiskMonitorAgent(BaseAgent):
 
     async def _check_exposure(self):
         """Check if total exposure exceeds limit"""
-        db = get_db_manager()
+        db = await get_db_manager()
         conn = await db.get_connection()
 
         try:
@@ -215,7 +235,7 @@ class RiskMonitorAgent(BaseAgent):
             """)
 
             # Calculate total exposure
-            total_exposure = Decimal('0')
+            total_exposure = _ZERO
             for pos in positions:
                 symbol = pos['symbol']
                 quantity = Decimal(str(pos['total_quantity']))
@@ -232,7 +252,7 @@ class RiskMonitorAgent(BaseAgent):
 
             # Check if exceeds limit
             if exposure_pct > self.max_exposure_pct:
-                await self.publish(RiskAlertEvent(
+                await self._publish_alert(RiskAlertEvent(
                     alert_type='exposure',
                     severity='critical',
                     message=f"Total exposure {exposure_pct:.2f}% exceeds limit "
@@ -250,7 +270,7 @@ class RiskMonitorAgent(BaseAgent):
 
             # Warning threshold
             elif exposure_pct > self.max_exposure_pct * self.warning_threshold:
-                await self.publish(RiskAlertEvent(
+                await self._publish_alert(RiskAlertEvent(
                     alert_type='exposure',
                     severity='warning',
                     message=f"Exposure {exposure_pct:.2f}% approaching limit "
@@ -333,7 +353,7 @@ class RiskMonitorAgent(BaseAgent):
 
         # Warning threshold
         elif daily_loss_pct < -(self.max_daily_loss_pct * self.warning_threshold):
-            await self.publish(RiskAlertEvent(
+            await self._publish_alert(RiskAlertEvent(
                 alert_type='daily_loss',
                 severity='warning',
                 message=f"Daily loss {abs(daily_loss_pct):.2f}% approaching limit "
@@ -346,19 +366,19 @@ class RiskMonitorAgent(BaseAgent):
 
     async def _check_strategy_drawdowns(self):
         """Check per-strategy drawdown limits"""
-        db = get_db_manager()
+        db = await get_db_manager()
         conn = await db.get_connection()
 
         try:
-            # Get strategy performance
+            # Get latest performance snapshot for each strategy
             strategies = await conn.fetch("""
-                SELECT
+                SELECT DISTINCT ON (strategy_name)
                     strategy_name,
                     total_pnl,
                     max_drawdown
                 FROM strategy_performance
                 WHERE time >= NOW() - INTERVAL '24 hours'
-                ORDER BY time DESC
+                ORDER BY strategy_name, time DESC
             """)
 
             for strategy in strategies:
@@ -367,11 +387,11 @@ class RiskMonitorAgent(BaseAgent):
 
                 # Track peak value for drawdown calculation
                 if strategy_name not in self.strategy_peak_values:
-                    self.strategy_peak_values[strategy_name] = Decimal('0')
+                    self.strategy_peak_values[strategy_name] = _ZERO
 
                 # Check if drawdown exceeds limit
                 if max_drawdown > float(self.max_strategy_drawdown_pct):
-                    await self.publish(RiskAlertEvent(
+                    await self._publish_alert(RiskAlertEvent(
                         alert_type='strategy_drawdown',
                         severity='critical',
                         message=f"Strategy {strategy_name} drawdown {max_drawdown:.2f}% "
@@ -390,14 +410,44 @@ class RiskMonitorAgent(BaseAgent):
         finally:
             await db.release_connection(conn)
 
+    def _update_price(self, symbol: str, price: Decimal):
+        """
+        Record a new market price and adjust the cached portfolio value.
+
+        Args:
+            symbol: Trading symbol
+            price: Latest price
+        """
+        old_price = self.current_prices.get(symbol)
+        self.current_prices[symbol] = price
+
+        quantity = self._pv_quantities.get(symbol)
+        if self._pv_cache is not None and quantity is not None:
+            self._pv_cache += quantity * (price - (old_price or _ZERO))
+
+    def _invalidate_portfolio_value(self):
+        """Drop the cached portfolio value so the next read hits the database"""
+        self._pv_cache = None
+        self._pv_quantities = {}
+        # Reads already in flight must not store their (older) result
+        self._pv_generation += 1
+
     async def _get_current_portfolio_value(self) -> Optional[Decimal]:
         """
         Get current total portfolio value.
 
+        Served from cache when possible; the cache is invalidated on each
+        trade, kept current on price ticks by _update_price(), and expires
+        after portfolio_value_ttl_seconds.
+
         Returns:
             Current portfolio value or None if unavailable
         """
-        db = get_db_manager()
+        if self._pv_cache is not None and time.monotonic() < self._pv_expires_at:
+            return self._pv_cache
+
+        generation = self._pv_generation
+        db = await get_db_manager()
         conn = await db.get_connection()
 
         try:
@@ -409,7 +459,7 @@ class RiskMonitorAgent(BaseAgent):
                 WHERE time >= NOW() - INTERVAL '30 days'
             """)
 
-            net_cash = Decimal(str(result['net_cash'])) if result['net_cash'] else Decimal('0')
+            net_cash = Decimal(str(result['net_cash'])) if result['net_cash'] else _ZERO
             cash_value = self.initial_portfolio_value + net_cash
 
             # Get position values
@@ -421,16 +471,22 @@ class RiskMonitorAgent(BaseAgent):
                 HAVING SUM(quantity) > 0
             """)
 
-            position_value = Decimal('0')
+            position_value = _ZERO
+            quantities = {}
             for pos in positions:
                 symbol = pos['symbol']
                 quantity = Decimal(str(pos['total_quantity']))
+                quantities[symbol] = quantity
                 price = self.current_prices.get(symbol)
 
                 if price:
                     position_value += quantity * price
 
             total_value = cash_value + position_value
+            if generation == self._pv_generation:
+                self._pv_cache = total_value
+                self._pv_quantities = quantities
+                self._pv_expires_at = time.monotonic() + self.portfolio_value_ttl_seconds
             return total_value
 
         except Exception as e:
@@ -439,6 +495,28 @@ class RiskMonitorAgent(BaseAgent):
         finally:
             await db.release_connection(conn)
 
+    async def _publish_alert(self, alert: RiskAlertEvent):
+        """
+        Publish a risk alert unless an identical one was sent recently.
+
+        A persistent breach would otherwise raise the same alert on every
+        check cycle. Alerts are keyed on (alert_type, severity, strategy).
+
+        Args:
+            alert: Risk alert to publish
+        """
+        strategy_name = alert.strategy_name or (alert.metadata or {}).get('strategy_name')
+        key = (alert.alert_type, alert.severity, strategy_name)
+        now = time.monotonic()
+
+        last_sent = self._alert_cache.get(key)
+        if last_sent is not None and now - last_sent < self.alert_cooldown_seconds:
+            logger.debug(f"Suppressing duplicate risk alert: {key}")
+            return
+
+        self._alert_cache[key] = now
+        await self.publish(alert)
+
     def is_halt_active(self) -> bool:
         """Check if emergency halt is active"""
         return self.halt_active
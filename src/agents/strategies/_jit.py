@@ -0,0 +1,28 @@
+"""
+JIT Helpers
+
+Compiles indicator kernels with Numba when it is installed.
+Without Numba the kernels run as plain Python/NumPy.
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def jit(signature: str):
+    """
+    Compile a kernel ahead of first use if Numba is available
+
+    Args:
+        signature: Numba type signature, e.g. 'float64[:](float64[:], int64)'
+
+    Returns:
+        Decorator returning the compiled kernel, or the function unchanged
+    """
+    def decorate(func):
+        if njit is None:
+            return func
+        # An explicit signature compiles at import; cache=True reuses it across runs
+        return njit(signature, cache=True)(func)
+    return decorate
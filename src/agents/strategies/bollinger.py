@@ -7,14 +7,76 @@ Uses Bollinger Bands indicator:
 
 Reference: backtest_bollinger.py
 """
-import pandas as pd
 import numpy as np
 from decimal import Decimal
 from typing import Optional
-from src.agents.strategy import StrategyAgent
+from src.agents.strategy import StrategyAgent, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+from src.agents.strategies._jit import jit
 from src.models.events import TradingSignalEvent
 
 
+@jit('UniTuple(float64[:], 3)(float64[:], int64, float64)')
+def _bollinger_kernel(prices, period, num_std):
+    """Rolling SMA and sample-std bands over a float64 price array"""
+    n = prices.shape[0]
+    sma = np.empty(n)
+    upper_band = np.empty(n)
+    lower_band = np.empty(n)
+
+    # A one-point window has a mean but no sample std, as in pandas
+    if period < 2:
+        sma[:] = prices
+        upper_band[:] = np.nan
+        lower_band[:] = np.nan
+        return sma, upper_band, lower_band
+
+    warmup = min(period - 1, n)
+    sma[:warmup] = np.nan
+    upper_band[:warmup] = np.nan
+    lower_band[:warmup] = np.nan
+    if warmup == n:
+        return sma, upper_band, lower_band
+
+    # Running sum and sum of squares, shifted by the first price so the
+    # variance does not lose precision at large price levels
+    shift = prices[0]
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        x = prices[i] - shift
+        s += x
+        s2 += x * x
+
+        if i >= period:
+            old = prices[i - period] - shift
+            s -= old
+            s2 -= old * old
+
+        if i < period - 1:
+            continue
+
+        # Once per window, re-anchor on the window start and recompute the
+        # sums exactly so rounding error cannot build up over long runs
+        if (i + 1) % period == 0:
+            shift = prices[i - period + 1]
+            s = 0.0
+            s2 = 0.0
+            for j in range(i - period + 1, i + 1):
+                x = prices[j] - shift
+                s += x
+                s2 += x * x
+
+        mean = s / period
+        var = max(0.0, (s2 - s * mean) / (period - 1))
+        std = np.sqrt(var)
+
+        sma[i] = mean + shift
+        upper_band[i] = sma[i] + std * num_std
+        lower_band[i] = sma[i] - std * num_std
+
+    return sma, upper_band, lower_band
+
+
 def calculate_bollinger_bands(prices, period=20, num_std=2):
     """
     Calculate Bollinger Bands
@@ -27,19 +89,9 @@ def calculate_bollinger_bands(prices, period=20, num_std=2):
     Returns:
         Tuple of (sma, upper_band, lower_band) as numpy arrays
     """
-    prices_series = pd.Series(prices)
-
-    # Calculate SMA (Simple Moving Average)
-    sma = prices_series.rolling(window=period).mean().values
-
-    # Calculate standard deviation
-    std = prices_series.rolling(window=period).std().values
-
-    # Calculate bands
-    upper_band = sma + (std * num_std)
-    lower_band = sma - (std * num_std)
-
-    return sma, upper_band, lower_band
+    return _bollinger_kernel(
+        np.asarray(prices, dtype=np.float64), int(period), float(num_std)
+    )
 
 
 class BollingerBandsStrategy(StrategyAgent):
@@ -78,6 +130,34 @@ class BollingerBandsStrategy(StrategyAgent):
         super().__init__('bollinger', event_bus, symbol, params)
         self.previous_signal = None
 
+        # Kernel arguments, converted once rather than per analyze()
+        self._period = int(period)
+        self._num_std_f = float(num_std)
+
+    def analyze_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute signals for a whole price series in one pass
+
+        Args:
+            prices: Price series, oldest first
+
+        Returns:
+            int8 array of side codes (see StrategyAgent.analyze_batch)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sma, upper_band, lower_band = calculate_bollinger_bands(
+            prices,
+            period=self._period,
+            num_std=self._num_std_f
+        )
+
+        # Buy at/below lower band, sell at/above upper band (NaN compares False)
+        raw = np.where(
+            prices <= lower_band, SIGNAL_BUY,
+            np.where(prices >= upper_band, SIGNAL_SELL, SIGNAL_HOLD)
+        )
+        return self._signals_on_change(raw)
+
     async def analyze(self) -> Optional[TradingSignalEvent]:
         """
         Analyze prices and generate trading signal
@@ -85,33 +165,27 @@ class BollingerBandsStrategy(StrategyAgent):
         Returns:
             TradingSignalEvent if signal generated, else None
         """
-        df = self.get_prices_df()
+        prices = self.prices_view()
 
         # Check if enough data
-        if len(df) < self.params['period']:
+        if len(prices) < self._period:
             return None
 
         # Calculate Bollinger Bands
         sma, upper_band, lower_band = calculate_bollinger_bands(
-            df['price'].values,
-            period=self.params['period'],
-            num_std=self.params['num_std']
+            prices,
+            period=self._period,
+            num_std=self._num_std_f
         )
 
-        # Add to dataframe
-        df['sma'] = sma
-        df['upper_band'] = upper_band
-        df['lower_band'] = lower_band
-
         # Get current values
-        current = df.iloc[-1]
-        current_price = current['price']
-        current_lower = current['lower_band']
-        current_upper = current['upper_band']
-        current_sma = current['sma']
+        current_price = prices[-1]
+        current_lower = lower_band[-1]
+        current_upper = upper_band[-1]
+        current_sma = sma[-1]
 
         # Check for NaN
-        if pd.isna(current_lower) or pd.isna(current_upper):
+        if np.isnan(current_lower) or np.isnan(current_upper):
             return None
 
         # Determine signal
@@ -5,12 +5,37 @@ Moving Average Convergence Divergence (MACD) indicator strategy.
 - Buy when MACD line crosses above signal line
 - Sell when MACD line crosses below signal line
 """
-import pandas as pd
+import numpy as np
 from decimal import Decimal
-from src.agents.strategy import StrategyAgent
+from src.agents.strategy import StrategyAgent, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+from src.agents.strategies._jit import jit
 from src.models.events import TradingSignalEvent
 
 
+@jit('UniTuple(float64[:], 2)(float64[:], float64, float64, float64)')
+def _macd_kernel(prices, alpha_fast, alpha_slow, alpha_signal):
+    """MACD and signal lines over a float64 price array (pandas ewm, adjust=False)"""
+    n = prices.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    if n == 0:
+        return macd, signal
+
+    # Same recurrences as MACDStrategy._update_emas, so batch and live agree
+    fast_ema = prices[0]
+    slow_ema = prices[0]
+    macd[0] = 0.0
+    signal[0] = 0.0
+    for i in range(1, n):
+        price = prices[i]
+        fast_ema = alpha_fast * price + (1 - alpha_fast) * fast_ema
+        slow_ema = alpha_slow * price + (1 - alpha_slow) * slow_ema
+        macd[i] = fast_ema - slow_ema
+        signal[i] = alpha_signal * macd[i] + (1 - alpha_signal) * signal[i - 1]
+
+    return macd, signal
+
+
 class MACDStrategy(StrategyAgent):
     """MACD indicator strategy"""
 
@@ -25,44 +50,89 @@ class MACDStrategy(StrategyAgent):
         super().__init__('macd', event_bus, symbol, params)
         self.previous_signal = None
 
+        # Incremental EMA state, advanced once per price
+        self._alpha_fast = 2.0 / (params['fast_period'] + 1)
+        self._alpha_slow = 2.0 / (params['slow_period'] + 1)
+        self._alpha_signal = 2.0 / (params['signal_period'] + 1)
+        self._fast_ema: float | None = None
+        self._slow_ema: float | None = None
+        self._signal_ema: float | None = None
+        self._macd: float | None = None
+        self._prev_macd: float | None = None
+        self._prev_signal_ema: float | None = None
+        self._last_price: float | None = None
+
+    def append_tick(self, ts_ns: int, price: float, volume: float):
+        """Store the tick and advance the EMAs"""
+        super().append_tick(ts_ns, price, volume)
+        self._update_emas(price)
+
+    def _append_many(self, times, prices, volumes):
+        """Store a batch of ticks and advance the EMAs through it"""
+        super()._append_many(times, prices, volumes)
+        for price in prices.tolist():
+            self._update_emas(price)
+
+    def _update_emas(self, price: float):
+        """Advance fast/slow/signal EMAs by one price (pandas ewm, adjust=False)"""
+        self._prev_macd = self._macd
+        self._prev_signal_ema = self._signal_ema
+        self._last_price = price
+
+        if self._fast_ema is None:
+            self._fast_ema = price
+            self._slow_ema = price
+        else:
+            a = self._alpha_fast
+            self._fast_ema = a * price + (1 - a) * self._fast_ema
+            a = self._alpha_slow
+            self._slow_ema = a * price + (1 - a) * self._slow_ema
+
+        # MACD line = Fast EMA - Slow EMA; signal line = EMA of MACD
+        self._macd = self._fast_ema - self._slow_ema
+        if self._signal_ema is None:
+            self._signal_ema = self._macd
+        else:
+            a = self._alpha_signal
+            self._signal_ema = a * self._macd + (1 - a) * self._signal_ema
+
+    def analyze_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute signals for a whole price series in one pass
+
+        Args:
+            prices: Price series, oldest first
+
+        Returns:
+            int8 array of side codes (see StrategyAgent.analyze_batch)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        macd, signal_line = _macd_kernel(
+            prices, self._alpha_fast, self._alpha_slow, self._alpha_signal
+        )
+        side = np.where(macd > signal_line, SIGNAL_BUY, SIGNAL_SELL)
+
+        # A side is raised only where it flips, once the signal line has
+        # had slow_period + signal_period prices
+        raw = np.full(len(prices), SIGNAL_HOLD)
+        crossed = np.flatnonzero(side[1:] != side[:-1]) + 1
+        crossed = crossed[crossed >= self.params['slow_period'] + self.params['signal_period'] - 1]
+        raw[crossed] = side[crossed]
+        return self._signals_on_change(raw)
+
     async def analyze(self) -> TradingSignalEvent | None:
         """Generate signal based on MACD crossover"""
-        df = self.get_prices_df()
-
-        if len(df) < self.params['slow_period'] + self.params['signal_period']:
+        if self._count < self.params['slow_period'] + self.params['signal_period']:
             return None
 
-        # Calculate MACD
-        fast_period = self.params['fast_period']
-        slow_period = self.params['slow_period']
-        signal_period = self.params['signal_period']
-
-        # Calculate EMAs
-        df['ema_fast'] = df['price'].ewm(span=fast_period, adjust=False).mean()
-        df['ema_slow'] = df['price'].ewm(span=slow_period, adjust=False).mean()
-
-        # MACD line = Fast EMA - Slow EMA
-        df['macd'] = df['ema_fast'] - df['ema_slow']
-
-        # Signal line = EMA of MACD
-        df['signal'] = df['macd'].ewm(span=signal_period, adjust=False).mean()
-
-        # MACD histogram
-        df['histogram'] = df['macd'] - df['signal']
-
-        # Get current and previous values
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
-
-        # Check for NaN values
-        if pd.isna(current['macd']) or pd.isna(current['signal']):
-            return None
-        if pd.isna(previous['macd']) or pd.isna(previous['signal']):
-            return None
+        macd = self._macd
+        signal_line = self._signal_ema
+        histogram = macd - signal_line
+        price = self._last_price
 
         # Detect crossover
-        current_signal = 'buy' if current['macd'] > current['signal'] else 'sell'
-        previous_signal = 'buy' if previous['macd'] > previous['signal'] else 'sell'
+        current_signal = 'buy' if macd > signal_line else 'sell'
+        previous_signal = 'buy' if self._prev_macd > self._prev_signal_ema else 'sell'
 
         # Only signal on crossover
         if current_signal != previous_signal:
@@ -73,8 +143,7 @@ class MACDStrategy(StrategyAgent):
             self.previous_signal = current_signal
 
             # Calculate confidence based on histogram strength
-            histogram_abs = abs(float(current['histogram']))
-            price = float(current['price'])
+            histogram_abs = abs(histogram)
             histogram_pct = (histogram_abs / price) * 100 if price > 0 else 0
 
             # Higher confidence for stronger divergence
@@ -87,10 +156,10 @@ class MACDStrategy(StrategyAgent):
                 confidence=confidence,
                 reason=f"MACD {'bullish' if current_signal == 'buy' else 'bearish'} crossover",
                 metadata={
-                    'macd': float(current['macd']),
-                    'signal': float(current['signal']),
-                    'histogram': float(current['histogram']),
-                    'price': float(current['price'])
+                    'macd': macd,
+                    'signal': signal_line,
+                    'histogram': histogram,
+                    'price': price
                 }
             )
 
@@ -7,45 +7,43 @@ Uses RSI (Relative Strength Index):
 
 Reference: backtest_meanreversion.py
 """
-import pandas as pd
 import numpy as np
 from decimal import Decimal
 from typing import Optional
-from src.agents.strategy import StrategyAgent
+from src.agents.strategy import StrategyAgent, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+from src.agents.strategies._jit import jit
 from src.models.events import TradingSignalEvent
 
 
-def calculate_rsi(prices, period=14):
-    """
-    Calculate RSI (Relative Strength Index)
-
-    Args:
-        prices: Array of prices
-        period: RSI period (default 14)
-
-    Returns:
-        Array of RSI values (0-100)
-    """
-    # Calculate price changes
-    deltas = np.diff(prices)
-
-    # Separate gains and losses
-    seed = deltas[:period + 1]
-    up = seed[seed >= 0].sum() / period
-    down = -seed[seed < 0].sum() / period
+@jit('float64[:](float64[:], int64)')
+def _rsi_kernel(prices, period):
+    """Wilder-smoothed RSI over a float64 price array"""
+    n = prices.shape[0]
+    rsi = np.empty(n)
+
+    # Seed average gain/loss from the first period + 1 changes
+    up = 0.0
+    down = 0.0
+    for j in range(min(period + 1, n - 1)):
+        delta = prices[j + 1] - prices[j]
+        if delta >= 0:
+            up += delta
+        elif delta < 0:
+            down -= delta
+    up /= period
+    down /= period
 
     # Handle division by zero
     if down == 0:
-        return np.full(len(prices), 100.0)
+        rsi[:] = 100.0
+        return rsi
 
-    # Calculate initial RS and RSI
     rs = up / down
-    rsi = np.zeros_like(prices)
     rsi[:period] = 100.0 - 100.0 / (1.0 + rs)
 
     # Calculate RSI for remaining values using smoothed RS
-    for i in range(period, len(prices)):
-        delta = deltas[i - 1]
+    for i in range(period, n):
+        delta = prices[i] - prices[i - 1]
 
         if delta > 0:
             upval = delta
@@ -58,7 +56,6 @@ def calculate_rsi(prices, period=14):
         up = (up * (period - 1) + upval) / period
         down = (down * (period - 1) + downval) / period
 
-        # Calculate RSI
         if down == 0:
             rsi[i] = 100.0
         else:
@@ -68,6 +65,20 @@ def calculate_rsi(prices, period=14):
     return rsi
 
 
+def calculate_rsi(prices, period=14):
+    """
+    Calculate RSI (Relative Strength Index)
+
+    Args:
+        prices: Array of prices
+        period: RSI period (default 14)
+
+    Returns:
+        Array of RSI values (0-100)
+    """
+    return _rsi_kernel(np.asarray(prices, dtype=np.float64), int(period))
+
+
 class MeanReversionStrategy(StrategyAgent):
     """
     Mean Reversion trading strategy using RSI
@@ -107,6 +118,29 @@ class MeanReversionStrategy(StrategyAgent):
         super().__init__('meanreversion', event_bus, symbol, params)
         self.previous_signal = None
 
+        # Kernel arguments and thresholds, converted once rather than per analyze()
+        self._rsi_period = int(rsi_period)
+        self._oversold_f = float(oversold_threshold)
+        self._overbought_f = float(overbought_threshold)
+
+    def analyze_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute signals for a whole price series in one pass
+
+        Args:
+            prices: Price series, oldest first
+
+        Returns:
+            int8 array of side codes (see StrategyAgent.analyze_batch)
+        """
+        rsi_values = calculate_rsi(prices, period=self._rsi_period)
+
+        raw = np.where(
+            rsi_values < self._oversold_f, SIGNAL_BUY,
+            np.where(rsi_values > self._overbought_f, SIGNAL_SELL, SIGNAL_HOLD)
+        )
+        return self._signals_on_change(raw)
+
     async def analyze(self) -> Optional[TradingSignalEvent]:
         """
         Analyze prices and generate trading signal
@@ -114,34 +148,31 @@ class MeanReversionStrategy(StrategyAgent):
         Returns:
             TradingSignalEvent if signal generated, else None
         """
-        df = self.get_prices_df()
+        prices = self.prices_view()
 
         # Check if enough data
-        if len(df) < self.params['rsi_period']:
+        if len(prices) < self._rsi_period:
             return None
 
         # Calculate RSI
         rsi_values = calculate_rsi(
-            df['price'].values,
-            period=self.params['rsi_period']
+            prices,
+            period=self._rsi_period
         )
 
-        df['rsi'] = rsi_values
-
         # Get current values
-        current = df.iloc[-1]
-        current_price = current['price']
-        current_rsi = current['rsi']
+        current_price = prices[-1]
+        current_rsi = rsi_values[-1]
 
         # Check for NaN
-        if pd.isna(current_rsi):
+        if np.isnan(current_rsi):
             return None
 
         # Determine signal
         signal = None
 
         # Buy signal: RSI < oversold threshold
-        if current_rsi < self.params['oversold_threshold']:
+        if current_rsi < self._oversold_f:
             if self.previous_signal != 'buy':
                 self.previous_signal = 'buy'
                 signal = TradingSignalEvent(
@@ -158,7 +189,7 @@ class MeanReversionStrategy(StrategyAgent):
                 )
 
         # Sell signal: RSI > overbought threshold
-        elif current_rsi > self.params['overbought_threshold']:
+        elif current_rsi > self._overbought_f:
             if self.previous_signal != 'sell':
                 self.previous_signal = 'sell'
                 signal = TradingSignalEvent(
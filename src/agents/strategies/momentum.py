@@ -5,12 +5,25 @@ Uses 20-period and 50-period moving averages.
 - Buy when 20MA crosses above 50MA
 - Sell when 20MA crosses below 50MA
 """
-import pandas as pd
+import numpy as np
 from decimal import Decimal
-from src.agents.strategy import StrategyAgent
+from src.agents.strategy import StrategyAgent, cached_by_version, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
 from src.models.events import TradingSignalEvent
 
 
+def _rolling_mean(prices: np.ndarray, period: int) -> np.ndarray:
+    """Trailing mean over a float64 price array, NaN until the first full window"""
+    sma = np.full(len(prices), np.nan)
+    if len(prices) < period:
+        return sma
+
+    # Cumulative sums shifted by the first price so they stay small at
+    # large price levels
+    csum = np.concatenate(([0.0], np.cumsum(prices - prices[0])))
+    sma[period - 1:] = (csum[period:] - csum[:-period]) / period + prices[0]
+    return sma
+
+
 class MomentumStrategy(StrategyAgent):
     """Moving average crossover strategy"""
 
@@ -24,33 +37,65 @@ class MomentumStrategy(StrategyAgent):
         super().__init__('momentum', event_bus, symbol, params)
         self.previous_signal = None
 
-    async def analyze(self) -> TradingSignalEvent | None:
-        """Generate signal based on MA crossover"""
-        df = self.get_prices_df()
+    def _sma_pair(self, period: int) -> tuple[float, float]:
+        """Moving average at the latest price and at the one before it"""
+        prices = self.prices_view()
+        return (
+            float(prices[-period:].mean()),
+            float(prices[-period - 1:-1].mean())
+        )
 
-        if len(df) < self.params['ma_long']:
-            return None
+    @cached_by_version
+    def sma_short(self) -> tuple[float, float]:
+        """Short MA (current, previous)"""
+        return self._sma_pair(self.params['ma_short'])
 
-        # Calculate moving averages
-        ma_short = self.params['ma_short']
+    @cached_by_version
+    def sma_long(self) -> tuple[float, float]:
+        """Long MA (current, previous)"""
+        return self._sma_pair(self.params['ma_long'])
+
+    def analyze_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute signals for a whole price series in one pass
+
+        Args:
+            prices: Price series, oldest first
+
+        Returns:
+            int8 array of side codes (see StrategyAgent.analyze_batch)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
         ma_long = self.params['ma_long']
 
-        df['ma_short'] = df['price'].rolling(window=ma_short).mean()
-        df['ma_long'] = df['price'].rolling(window=ma_long).mean()
+        side = np.where(
+            _rolling_mean(prices, self.params['ma_short']) > _rolling_mean(prices, ma_long),
+            SIGNAL_BUY, SIGNAL_SELL
+        )
 
-        # Get current and previous values
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
+        # A side is raised only where it flips, once both MAs exist at the
+        # current and previous price
+        raw = np.full(len(prices), SIGNAL_HOLD)
+        crossed = np.flatnonzero(side[1:] != side[:-1]) + 1
+        crossed = crossed[crossed >= ma_long]
+        raw[crossed] = side[crossed]
+        return self._signals_on_change(raw)
 
-        # Check for NaN values
-        if pd.isna(current['ma_short']) or pd.isna(current['ma_long']):
-            return None
-        if pd.isna(previous['ma_short']) or pd.isna(previous['ma_long']):
+    async def analyze(self) -> TradingSignalEvent | None:
+        """Generate signal based on MA crossover"""
+        ma_short = self.params['ma_short']
+        ma_long = self.params['ma_long']
+
+        # Need a full long window at both the current and previous price
+        if self._count < ma_long + 1:
             return None
 
+        current_short, previous_short = self.sma_short()
+        current_long, previous_long = self.sma_long()
+
         # Detect crossover
-        current_signal = 'buy' if current['ma_short'] > current['ma_long'] else 'sell'
-        previous_signal = 'buy' if previous['ma_short'] > previous['ma_long'] else 'sell'
+        current_signal = 'buy' if current_short > current_long else 'sell'
+        previous_signal = 'buy' if previous_short > previous_long else 'sell'
 
         # Only signal on crossover (change in signal)
         if current_signal != previous_signal:
@@ -67,9 +112,9 @@ class MomentumStrategy(StrategyAgent):
                 confidence=0.7,
                 reason=f"MA crossover: {ma_short}MA {'above' if current_signal == 'buy' else 'below'} {ma_long}MA",
                 metadata={
-                    'ma_short': float(current['ma_short']),
-                    'ma_long': float(current['ma_long']),
-                    'price': float(current['price'])
+                    'ma_short': current_short,
+                    'ma_long': current_long,
+                    'price': float(self.prices_view()[-1])
                 }
             )
 
@@ -4,15 +4,103 @@ Base Strategy Agent
 All trading strategies inherit from this class.
 Provides common functionality for signal generation.
 """
+import functools
 import logging
 from abc import abstractmethod
+from datetime import datetime
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 from src.agents.base import BaseAgent
 from src.models.events import MarketTickEvent, TradingSignalEvent
 
 logger = logging.getLogger(__name__)
 
+# Side codes returned by analyze_batch()
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+
+
+def cached_by_version(method):
+    """
+    Cache a zero-argument indicator method until the price buffers change
+
+    The cached value is keyed on the strategy's buffer version, which is
+    bumped on every append.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        hit = self._indicator_cache.get(name)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        value = method(self)
+        self._indicator_cache[name] = (self._version, value)
+        return value
+
+    return wrapper
+
+
+def _to_ns(ts) -> int:
+    """Convert a datetime (or ns integer) to int64 nanoseconds"""
+    if isinstance(ts, datetime):
+        return int(np.datetime64(ts, 'ns').astype(np.int64))
+    return int(ts)
+
+
+class PriceHistoryView:
+    """
+    List-like view over a strategy's tick buffers
+
+    Supports len(), iteration and indexing as dicts with time/price/volume
+    keys, and append() of such a dict, so code written against the old
+    list-of-dicts history keeps working.
+    """
+
+    __slots__ = ('_strategy',)
+
+    def __init__(self, strategy: 'StrategyAgent'):
+        self._strategy = strategy
+
+    def __len__(self) -> int:
+        return self._strategy._count
+
+    def __iter__(self):
+        s = self._strategy
+        times = s._ordered(s._times).view('datetime64[ns]')
+        for t, p, v in zip(times, s._ordered(s._prices).tolist(), s._ordered(s._vols).tolist()):
+            yield {'time': t, 'price': p, 'volume': v}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('price history index out of range')
+        return self._row(index)
+
+    def _row(self, index: int) -> dict:
+        """Build the dict for the index-th oldest tick (0 <= index < len)"""
+        s = self._strategy
+        slot = (s._head - s._count + index) % s.max_history
+        return {
+            'time': np.datetime64(int(s._times[slot]), 'ns'),
+            'price': float(s._prices[slot]),
+            'volume': float(s._vols[slot]),
+        }
+
+    def append(self, tick: dict) -> None:
+        """Append a {'time', 'price', 'volume'} dict"""
+        self._strategy.append_tick(
+            _to_ns(tick.get('time', datetime.now())),
+            float(tick['price']),
+            float(tick.get('volume', 1.0))
+        )
+
 
 class StrategyAgent(BaseAgent):
     """
@@ -25,37 +113,57 @@ class StrategyAgent(BaseAgent):
         super().__init__(name, event_bus)
         self.symbol = symbol
         self.params = params
-        self.price_history = []  # Store recent prices
         self.max_history = params.get('max_history', 200)
 
+        # Recent ticks live in preallocated parallel ring buffers
+        self._times = np.empty(self.max_history, dtype=np.int64)  # ns since epoch
+        self._prices = np.empty(self.max_history, dtype=np.float64)
+        self._vols = np.empty(self.max_history, dtype=np.float64)
+        self._head = 0  # Next slot to write
+        self._count = 0  # Number of valid slots
+        self._version = 0  # Bumped on every append
+        self._indicator_cache: dict[str, tuple[int, object]] = {}
+
+        # Subscribe to market data once, at construction
+        self._tick_queue = self.event_bus.subscribe(MarketTickEvent)
+
     async def start(self):
-        """Start strategy event loop"""
+        """Start strategy event loop (launched by run())"""
+        if not self._running:
+            raise RuntimeError(f"Strategy {self.name} must be started through run()")
         self.logger.info(f"Starting strategy {self.name} for {self.symbol}")
 
-        # Subscribe to market data
-        queue = self.event_bus.subscribe(MarketTickEvent)
+        async for batch in self._consume_batches(self._tick_queue):
+            ticks = [event for event in batch if event.symbol == self.symbol]
+            if ticks:
+                await self._handle_ticks(ticks)
 
-        async for event in self._consume_events(queue):
-            if event.symbol == self.symbol:
-                await self._handle_tick(event)
+    async def _handle_ticks(self, ticks: list[MarketTickEvent]):
+        """Process a batch of price updates in arrival order"""
+        # Ticks that only fill the warmup window are never analyzed, so
+        # write them into the buffers in one go
+        warmup_period = self.params.get('warmup_period', 50)
+        n_fill = min(len(ticks), max(0, warmup_period - 1 - self._count))
+        if n_fill:
+            head = ticks[:n_fill]
+            self._append_many(
+                np.array([t.timestamp for t in head], dtype='datetime64[ns]').view(np.int64),
+                np.fromiter((t.price_f for t in head), np.float64, n_fill),
+                np.fromiter((float(t.volume) for t in head), np.float64, n_fill)
+            )
+
+        for tick in ticks[n_fill:]:
+            await self._handle_tick(tick)
 
     async def _handle_tick(self, tick: MarketTickEvent):
         """Process price update"""
         # Add to history
-        self.price_history.append({
-            'time': tick.timestamp,
-            'price': float(tick.price),
-            'volume': float(tick.volume)
-        })
-
-        # Keep only recent history
-        if len(self.price_history) > self.max_history:
-            self.price_history.pop(0)
+        self.append_tick(_to_ns(tick.timestamp), tick.price_f, float(tick.volume))
 
         # Need minimum history before analyzing
         warmup_period = self.params.get('warmup_period', 50)
-        if len(self.price_history) < warmup_period:
-            self.logger.debug(f"Warming up: {len(self.price_history)}/{warmup_period}")
+        if self._count < warmup_period:
+            self.logger.debug(f"Warming up: {self._count}/{warmup_period}")
             return
 
         # Run strategy analysis
@@ -78,25 +186,120 @@ class StrategyAgent(BaseAgent):
         """
         pass
 
+    @abstractmethod
+    def analyze_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Compute signals for a whole price series in one vectorized pass
+
+        Backtest counterpart of analyze(): indicators run once over the full
+        array instead of once per tick. Does not touch live strategy state.
+
+        Args:
+            prices: Price series, oldest first
+
+        Returns:
+            int8 array of SIGNAL_BUY / SIGNAL_SELL / SIGNAL_HOLD per price
+        """
+        pass
+
+    def _signals_on_change(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Reduce raw per-price side codes to emitted signals
+
+        Mirrors the live path: nothing before warmup, and a side is only
+        emitted when it differs from the last emitted side.
+        """
+        raw = raw.astype(np.int8)
+        warmup_period = self.params.get('warmup_period', 50)
+        raw[:max(warmup_period - 1, 0)] = SIGNAL_HOLD
+
+        signals = np.zeros_like(raw)
+        idx = np.flatnonzero(raw)
+        if len(idx):
+            keep = np.ones(len(idx), dtype=bool)
+            keep[1:] = raw[idx[1:]] != raw[idx[:-1]]
+            signals[idx[keep]] = raw[idx[keep]]
+        return signals
+
+    def append_tick(self, ts_ns: int, price: float, volume: float):
+        """Write one tick into the ring buffers, overwriting the oldest when full"""
+        head = self._head
+        self._times[head] = ts_ns
+        self._prices[head] = price
+        self._vols[head] = volume
+        self._head = (head + 1) % self.max_history
+        if self._count < self.max_history:
+            self._count += 1
+        self._version += 1
+
+    def _append_many(self, times: np.ndarray, prices: np.ndarray, volumes: np.ndarray):
+        """Write several ticks into the ring buffers with one indexed store each"""
+        k = len(prices)
+        if k > self.max_history:
+            # Only the newest max_history ticks survive anyway
+            skip = k - self.max_history
+            self._head = (self._head + skip) % self.max_history
+            times, prices, volumes = times[skip:], prices[skip:], volumes[skip:]
+            k = self.max_history
+
+        idx = (self._head + np.arange(k)) % self.max_history
+        self._times[idx] = times
+        self._prices[idx] = prices
+        self._vols[idx] = volumes
+        self._head = (self._head + k) % self.max_history
+        self._count = min(self._count + k, self.max_history)
+        self._version += 1
+
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        """Return the valid part of a ring buffer, oldest first"""
+        if self._count < self.max_history:
+            return buf[:self._count]
+        return np.concatenate((buf[self._head:], buf[:self._head]))
+
+    def prices_view(self) -> np.ndarray:
+        """
+        Get recent prices as a float64 array, oldest first
+
+        Returns:
+            A view into the buffer until it wraps, then an ordered copy
+        """
+        return self._ordered(self._prices)
+
+    @property
+    def price_history(self) -> PriceHistoryView:
+        """Recent ticks as a list-like view over the buffers"""
+        return PriceHistoryView(self)
+
     def get_prices_df(self) -> pd.DataFrame:
         """Get price history as DataFrame"""
-        return pd.DataFrame(self.price_history)
+        return pd.DataFrame({
+            'time': self._ordered(self._times).view('datetime64[ns]'),
+            'price': self._ordered(self._prices),
+            'volume': self._ordered(self._vols)
+        })
 
-    def add_price(self, price: Decimal, volume: Decimal = Decimal('1.0')):
+    def _ingest_prices_np(self, prices: np.ndarray, volume: float = 1.0):
+        """
+        Append a whole price array to history in one store (for testing)
+
+        Args:
+            prices: Prices, oldest first
+            volume: Volume recorded for every price (default 1.0)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        self._append_many(
+            np.full(n, _to_ns(datetime.now()), dtype=np.int64),
+            prices,
+            np.full(n, volume, dtype=np.float64)
+        )
+
+    def add_price(self, price: Decimal | float, volume: Decimal | float = Decimal('1.0')):
         """
         Add price to history (for testing)
 
         Args:
-            price: Price to add
+            price: Price to add (Decimal or float)
             volume: Volume (default 1.0)
         """
-        import time
-        self.price_history.append({
-            'time': time.time(),
-            'price': float(price),
-            'volume': float(volume)
-        })
-
-        # Keep only recent history
-        if len(self.price_history) > self.max_history:
-            self.price_history.pop(0)
+        self.append_tick(_to_ns(datetime.now()), float(price), float(volume))
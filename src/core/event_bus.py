@@ -5,13 +5,141 @@ AsyncIO-based publish/subscribe event bus for inter-agent communication.
 """
 import asyncio
 import logging
-from typing import Any, Type, AsyncIterator
-from collections import defaultdict
+import threading
+from typing import Any, Type, AsyncIterator, Sequence
+from collections import deque
 from src.models.events import Event, get_event_type
 
 logger = logging.getLogger(__name__)
 
 
+class FastQueue:
+    """
+    Lightweight subscriber queue
+
+    Implements the part of the asyncio.Queue API the bus and agents use
+    (put_nowait, get, get_nowait, qsize, empty, full) on top of a deque,
+    without task_done()/join() bookkeeping. A waiter future is only
+    created when a consumer has to wait on an empty queue.
+
+    put_many() drops overflow through an explicit length check rather than
+    QueueFull, and counts what it dropped in `dropped`.
+
+    The deque is deliberate: its append/popleft are single C calls and it
+    recycles freed blocks, whereas a pre-sized list ring indexed from
+    Python measured about 3x slower for the same put/get traffic.
+    """
+
+    __slots__ = ('maxsize', 'dropped', '_items', '_getters')
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize queue
+
+        Args:
+            maxsize: Maximum items held (0 = unbounded)
+        """
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items: deque = deque()
+        self._getters: deque[asyncio.Future] = deque()
+
+    def qsize(self) -> int:
+        """Number of items in the queue"""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty"""
+        return not self._items
+
+    def full(self) -> bool:
+        """Return True if the queue holds maxsize items"""
+        return 0 < self.maxsize <= len(self._items)
+
+    def _wakeup_next(self) -> None:
+        """Wake the first getter that is still waiting"""
+        getters = self._getters
+        while getters:
+            waiter = getters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Put an item without blocking
+
+        Raises:
+            asyncio.QueueFull: If the queue is full
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+        if self._getters:
+            self._wakeup_next()
+
+    def put_many(self, items: Sequence[Any]) -> int:
+        """
+        Put a batch of items without blocking
+
+        Items beyond the free capacity are dropped. Waiting getters are
+        woken once per batch (at most one per item), not once per item.
+
+        Args:
+            items: Items to append, in order
+
+        Returns:
+            Number of items accepted
+        """
+        if self.maxsize > 0:
+            room = self.maxsize - len(self._items)
+            if room < len(items):
+                # Drop-newest: keep what fits, count the rest
+                room = max(room, 0)
+                self.dropped += len(items) - room
+                items = items[:room]
+        if not items:
+            return 0
+
+        self._items.extend(items)
+        getters = self._getters
+        if getters:
+            for _ in range(min(len(items), len(getters))):
+                self._wakeup_next()
+        return len(items)
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return an item if one is immediately available
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    async def get(self) -> Any:
+        """Remove and return an item, waiting until one is available"""
+        items = self._items
+        while not items:
+            waiter = asyncio.get_running_loop().create_future()
+            self._getters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self._getters.remove(waiter)
+                except ValueError:
+                    pass
+                # Hand the wakeup on if we were woken and then cancelled
+                if items and not waiter.cancelled():
+                    self._wakeup_next()
+                raise
+        return items.popleft()
+
+
 class EventBus:
     """
     Asynchronous publish/subscribe event bus
@@ -21,6 +149,10 @@ class EventBus:
     - Multiple subscribers per event type
     - Non-blocking publish
     - Automatic event logging
+
+    Subscriber lists are immutable tuples replaced wholesale on
+    subscribe/unsubscribe (copy-on-write), so publish reads them without
+    taking a lock.
     """
 
     def __init__(self, max_queue_size: int = 1000):
@@ -31,12 +163,19 @@ class EventBus:
             max_queue_size: Maximum events in each subscriber queue
         """
         self.max_queue_size = max_queue_size
-        self._subscribers: dict[str, list[asyncio.Queue]] = defaultdict(list)
+        # Exact event class -> subscriber queues. Both the dict and the
+        # tuples are replaced, never mutated, on (un)subscribe
+        self._subs: dict[type, tuple[FastQueue, ...]] = {}
         self._running = False
         self._published_count = 0
-        self._lock = asyncio.Lock()
-
-    def subscribe(self, event_type: Type[Event]) -> asyncio.Queue:
+        # Subscriber counts kept up to date by (un)subscribe for get_stats()
+        self._count_by_type: dict[str, int] = {}
+        self._total_subscribers = 0
+        self._dropped_count = 0
+        # Serializes writers only; publish never acquires it
+        self._write_lock = threading.Lock()
+
+    def subscribe(self, event_type: Type[Event]) -> FastQueue:
         """
         Subscribe to events of a specific type
 
@@ -51,17 +190,21 @@ class EventBus:
             async for event in consume_queue(queue):
                 process(event)
         """
-        event_type_name = event_type.__name__
-        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        event_type_name = event_type._event_name
+        queue = FastQueue(maxsize=self.max_queue_size)
 
-        self._subscribers[event_type_name].append(queue)
+        with self._write_lock:
+            subscribers = self._subs.get(event_type, ()) + (queue,)
+            self._subs = {**self._subs, event_type: subscribers}
+            self._count_by_type[event_type_name] = len(subscribers)
+            self._total_subscribers += 1
 
         logger.debug(f"Subscriber added for {event_type_name} "
-                    f"(total: {len(self._subscribers[event_type_name])})")
+                    f"(total: {len(subscribers)})")
 
         return queue
 
-    def unsubscribe(self, event_type: Type[Event], queue: asyncio.Queue) -> None:
+    def unsubscribe(self, event_type: Type[Event], queue: FastQueue) -> None:
         """
         Unsubscribe a queue from an event type
 
@@ -69,18 +212,28 @@ class EventBus:
             event_type: Event class to unsubscribe from
             queue: The queue to remove
         """
-        event_type_name = event_type.__name__
-
-        if event_type_name in self._subscribers:
-            try:
-                self._subscribers[event_type_name].remove(queue)
-                logger.debug(f"Subscriber removed for {event_type_name}")
-            except ValueError:
-                logger.warning(f"Queue not found in subscribers for {event_type_name}")
-
-    async def publish(self, event: Event) -> None:
+        event_type_name = event_type._event_name
+
+        with self._write_lock:
+            subscribers = self._subs.get(event_type)
+            if subscribers is None:
+                return
+            remaining = tuple(q for q in subscribers if q is not queue)
+            self._subs = {**self._subs, event_type: remaining}
+            self._count_by_type[event_type_name] = len(remaining)
+            self._total_subscribers -= len(subscribers) - len(remaining)
+
+        if len(remaining) < len(subscribers):
+            logger.debug(f"Subscriber removed for {event_type_name}")
+        else:
+            logger.warning(f"Queue not found in subscribers for {event_type_name}")
+
+    def publish_nowait(self, event: Event) -> None:
         """
-        Publish an event to all subscribers
+        Publish an event to all subscribers without yielding to the loop
+
+        Every put is non-blocking, so publishing needs no await; callers
+        on the hot path (or in synchronous code) can use this directly.
 
         Args:
             event: Event instance to publish
@@ -89,62 +242,112 @@ class EventBus:
             If a subscriber's queue is full, the event will be dropped
             for that subscriber (non-blocking publish)
         """
-        event_type_name = get_event_type(event)
+        self._published_count += 1
 
-        # Get subscribers for this event type
-        subscribers = self._subscribers.get(event_type_name, [])
+        # Single exact-type lookup on the current snapshot, no lock
+        subscribers = self._subs.get(type(event))
 
         if not subscribers:
-            logger.debug(f"No subscribers for {event_type_name}")
+            logger.debug(f"No subscribers for {get_event_type(event)}")
             return
 
-        # Publish to all subscribers
-        delivered = 0
-        dropped = 0
+        event_type_name = get_event_type(event)
+        delivered, dropped = self._fan_out(event_type_name, subscribers, (event,))
 
-        for queue in subscribers:
-            try:
-                # Non-blocking put - drop if queue is full
-                queue.put_nowait(event)
-                delivered += 1
-            except asyncio.QueueFull:
-                dropped += 1
-                logger.warning(
-                    f"Queue full for {event_type_name}, event dropped "
-                    f"(queue size: {queue.qsize()})"
-                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Published {event_type_name} to {delivered} subscribers "
+                f"({dropped} dropped)"
+            )
 
-        self._published_count += 1
+    async def publish(self, event: Event) -> None:
+        """
+        Publish an event to all subscribers
 
-        logger.debug(
-            f"Published {event_type_name} to {delivered} subscribers "
-            f"({dropped} dropped)"
-        )
+        Awaitable wrapper around publish_nowait() for existing callers.
+
+        Args:
+            event: Event instance to publish
+        """
+        self.publish_nowait(event)
 
     async def publish_multiple(self, events: list[Event]) -> None:
         """
         Publish multiple events efficiently
 
+        Events are grouped by type so each type's subscriber list is
+        looked up once per call rather than once per event, and each
+        subscriber queue receives its group with a single extend and
+        wakeup. Per-type order is preserved.
+
         Args:
             events: List of events to publish
         """
+        groups: dict[type, list[Event]] = {}
         for event in events:
-            await self.publish(event)
+            groups.setdefault(type(event), []).append(event)
+
+        self._published_count += len(events)
+
+        for event_class, group in groups.items():
+            subscribers = self._subs.get(event_class)
+            if not subscribers:
+                logger.debug(f"No subscribers for {event_class._event_name}")
+                continue
+
+            self._fan_out(event_class._event_name, subscribers, group)
+
+    def _fan_out(
+        self,
+        event_type_name: str,
+        subscribers: Sequence[FastQueue],
+        events: Sequence[Event]
+    ) -> tuple[int, int]:
+        """
+        Put events on every subscriber queue without blocking
+
+        Events are frozen, so every subscriber receives the same object;
+        nothing is copied or wrapped per subscriber.
+
+        Returns:
+            (deliveries, drops) summed over subscribers and events
+        """
+        delivered = 0
+        dropped = 0
+
+        for queue in subscribers:
+            # Non-blocking batch put - whatever does not fit is dropped
+            accepted = queue.put_many(events)
+            delivered += accepted
+            if accepted < len(events):
+                dropped += len(events) - accepted
+                self._dropped_count += len(events) - accepted
+                logger.warning(
+                    f"Queue full for {event_type_name}, "
+                    f"{len(events) - accepted} event(s) dropped "
+                    f"(queue size: {queue.qsize()})"
+                )
+
+        return delivered, dropped
 
     def get_subscriber_count(self, event_type: Type[Event]) -> int:
         """Get number of subscribers for an event type"""
-        event_type_name = event_type.__name__
-        return len(self._subscribers.get(event_type_name, []))
+        return len(self._subs.get(event_type, ()))
 
     def get_total_subscribers(self) -> int:
         """Get total number of active subscribers across all event types"""
-        return sum(len(queues) for queues in self._subscribers.values())
+        return self._total_subscribers
 
     @property
     def published_count(self) -> int:
         """Get total number of events published"""
         return self._published_count
 
+    @property
+    def dropped_count(self) -> int:
+        """Get total number of deliveries dropped on full queues"""
+        return self._dropped_count
+
     async def close(self) -> None:
         """
         Close the event bus and cleanup resources
@@ -154,7 +357,7 @@ class EventBus:
         logger.info("Closing event bus")
 
         # Clear all queues
-        for event_type_name, queues in self._subscribers.items():
+        for queues in self._subs.values():
             for queue in queues:
                 # Drain queue
                 while not queue.empty():
@@ -163,24 +366,29 @@ class EventBus:
                     except asyncio.QueueEmpty:
                         break
 
-        self._subscribers.clear()
+        with self._write_lock:
+            self._subs = {}
+            self._count_by_type = {}
+            self._total_subscribers = 0
         logger.info("Event bus closed")
 
     def get_stats(self) -> dict[str, Any]:
         """
         Get event bus statistics
 
+        Built from counters maintained on (un)subscribe/publish, so the
+        cost does not grow with the number of subscribers.
+
         Returns:
             Dictionary with stats about event bus usage
         """
+        count_by_type = dict(self._count_by_type)
         return {
             'total_published': self._published_count,
-            'total_subscribers': self.get_total_subscribers(),
-            'event_types': list(self._subscribers.keys()),
-            'subscribers_by_type': {
-                event_type: len(queues)
-                for event_type, queues in self._subscribers.items()
-            }
+            'total_dropped': self._dropped_count,
+            'total_subscribers': self._total_subscribers,
+            'event_types': list(count_by_type),
+            'subscribers_by_type': count_by_type
         }
 
 
@@ -241,9 +449,100 @@ async def close_event_bus() -> None:
 # Utility Functions
 # ============================================================================
 
-async def consume_events(queue: asyncio.Queue) -> AsyncIterator[Event]:
+class _QueueIterator:
+    """
+    Base for the queue consumers below
+
+    Hand-written async iterators: each step is a single __anext__ call
+    awaiting the queue, without async-generator asend/athrow machinery.
+    Like the generators they replace, they stop (rather than propagate)
+    when cancelled or when the queue raises, and stay stopped.
+    """
+
+    __slots__ = ('_queue', '_stopped')
+
+    def __init__(self, queue: FastQueue):
+        self._queue = queue
+        self._stopped = False
+
+    def __aiter__(self):
+        return self
+
+    def _stop(self, error: BaseException) -> StopAsyncIteration:
+        """Mark the iterator finished and log why"""
+        self._stopped = True
+        if isinstance(error, asyncio.CancelledError):
+            logger.info("Event consumer cancelled")
+        else:
+            logger.error(f"Error consuming event: {error}")
+        return StopAsyncIteration()
+
+
+class _EventIterator(_QueueIterator):
+    """Yields events one at a time"""
+
+    __slots__ = ()
+
+    async def __anext__(self) -> Event:
+        if self._stopped:
+            raise StopAsyncIteration
+        try:
+            return await self._queue.get()
+        except (asyncio.CancelledError, Exception) as e:
+            raise self._stop(e) from None
+
+
+class _EventBatchIterator(_QueueIterator):
+    """Yields everything already queued as one batch"""
+
+    __slots__ = ('_max_batch',)
+
+    def __init__(self, queue: FastQueue, max_batch: int):
+        super().__init__(queue)
+        self._max_batch = max_batch
+
+    async def __anext__(self) -> list[Event]:
+        if self._stopped:
+            raise StopAsyncIteration
+        queue = self._queue
+        try:
+            batch = [await queue.get()]
+        except (asyncio.CancelledError, Exception) as e:
+            raise self._stop(e) from None
+
+        limit = self._max_batch
+        while len(batch) < limit:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+
+class _EventTimeoutIterator(_QueueIterator):
+    """Yields events, or None when none arrives within the timeout"""
+
+    __slots__ = ('_timeout',)
+
+    def __init__(self, queue: FastQueue, timeout: float):
+        super().__init__(queue)
+        self._timeout = timeout
+
+    async def __anext__(self) -> Event | None:
+        if self._stopped:
+            raise StopAsyncIteration
+        try:
+            async with asyncio.timeout(self._timeout):
+                return await self._queue.get()
+        except asyncio.TimeoutError:
+            return None
+        except (asyncio.CancelledError, Exception) as e:
+            raise self._stop(e) from None
+
+
+def consume_events(queue: FastQueue) -> AsyncIterator[Event]:
     """
-    Async generator to consume events from a queue
+    Async iterator to consume events from a queue
 
     Args:
         queue: Queue to consume from
@@ -256,20 +555,31 @@ async def consume_events(queue: asyncio.Queue) -> AsyncIterator[Event]:
         async for event in consume_events(queue):
             print(event)
     """
-    while True:
-        try:
-            event = await queue.get()
-            yield event
-        except asyncio.CancelledError:
-            logger.info("Event consumer cancelled")
-            break
-        except Exception as e:
-            logger.error(f"Error consuming event: {e}")
-            break
+    return _EventIterator(queue)
+
+
+def consume_event_batches(
+    queue: FastQueue,
+    max_batch: int = 100
+) -> AsyncIterator[list[Event]]:
+    """
+    Async iterator that yields everything already queued as one batch
+
+    Waits for the first event, then drains whatever else is ready without
+    awaiting again, so a burst of events costs a single wakeup.
 
+    Args:
+        queue: Queue to consume from
+        max_batch: Maximum events per batch
 
-async def consume_events_with_timeout(
-    queue: asyncio.Queue,
+    Yields:
+        Non-empty lists of events, in arrival order
+    """
+    return _EventBatchIterator(queue, max_batch)
+
+
+def consume_events_with_timeout(
+    queue: FastQueue,
     timeout: float = 1.0
 ) -> AsyncIterator[Event | None]:
     """
@@ -282,15 +592,4 @@ async def consume_events_with_timeout(
     Yields:
         Event or None (on timeout)
     """
-    while True:
-        try:
-            event = await asyncio.wait_for(queue.get(), timeout=timeout)
-            yield event
-        except asyncio.TimeoutError:
-            yield None
-        except asyncio.CancelledError:
-            logger.info("Event consumer cancelled")
-            break
-        except Exception as e:
-            logger.error(f"Error consuming event: {e}")
-            break
+    return _EventTimeoutIterator(queue, timeout)
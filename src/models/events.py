@@ -2,67 +2,302 @@
 Event Models
 
 All event types used in the Icarus trading system.
-Events are immutable and use dataclasses for type safety.
+Events are immutable, slotted dataclasses for type safety and a small
+per-instance footprint (no __dict__).
 """
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, Optional
-from uuid import UUID, uuid4
+from numbers import Integral, Real
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Iterable, Mapping, Optional, Union, get_args, get_origin
+from uuid import UUID
 
 
 # ============================================================================
 # Base Event
 # ============================================================================
 
-@dataclass(frozen=True)
+# Shared zero default; Decimal is immutable and events are frozen, so one
+# instance serves every field
+_ZERO = Decimal('0')
+
+# Number of UUIDs generated per os.urandom() call
+_ID_POOL_SIZE = 1024
+
+# Pre-generated event ids. list.pop()/extend() are atomic under the GIL, so
+# no lock is needed; a concurrent refill just adds extra fresh ids.
+_id_pool: list[UUID] = []
+
+# A forked child must not hand out ids already pooled by its parent
+os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+def _new_event_id() -> UUID:
+    """
+    Generate a random (version 4) UUID
+
+    Equivalent to uuid4(), but reads os.urandom() once per _ID_POOL_SIZE
+    ids instead of once per id.
+    """
+    try:
+        return _id_pool.pop()
+    except IndexError:
+        raw = os.urandom(16 * _ID_POOL_SIZE)
+        _id_pool.extend([
+            UUID(bytes=raw[i:i + 16], version=4)
+            for i in range(0, len(raw), 16)
+        ])
+        return _id_pool.pop()
+
+
+# ============================================================================
+# Serialization
+# ============================================================================
+
+def _convert(v: Any) -> Any:
+    """Serialize a value whose declared type does not pin its conversion"""
+    if isinstance(v, (UUID, datetime)):
+        return str(v)
+    if isinstance(v, Decimal):
+        return float(v)
+    return v
+
+
+# Declared field type -> conversion for values of exactly that type (None
+# means the value is emitted as-is)
+_FIELD_CONVERSIONS = {
+    UUID: 'str',
+    datetime: 'str',
+    Decimal: 'float',
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+}
+
+# Event class -> generated to_dict function, built on first use
+_TO_DICT_CACHE: Dict[type, Any] = {}
+
+
+def _field_expression(name: str, declared: Any) -> str:
+    """
+    Source expression serializing self.<name> based on its declared type
+
+    Values of exactly the declared type take the pinned conversion; anything
+    else (None, or a value stored under a different type) falls back to
+    _convert, so output matches the per-value isinstance probe.
+    """
+    if get_origin(declared) is Union:
+        args = [a for a in get_args(declared) if a is not type(None)]
+        if len(args) == 1:
+            declared = args[0]
+
+    value = f'self.{name}'
+    if declared not in _FIELD_CONVERSIONS:
+        return f'_convert({value})'
+    func = _FIELD_CONVERSIONS[declared]
+    converted = value if func is None else f'{func}({value})'
+    return (
+        f'({converted} if {value}.__class__ is _{declared.__name__} '
+        f'else _convert({value}))'
+    )
+
+
+def _build_to_dict(cls: type):
+    """
+    Generate a straight-line to_dict for an event class
+
+    Each serialized field gets a conversion chosen once from its declared
+    type, guarded by one exact class check instead of the full isinstance
+    probe on every call. Fields with types not in _FIELD_CONVERSIONS keep
+    the generic per-value probe.
+    """
+    items = [
+        f'{f.name!r}: {_field_expression(f.name, f.type)}'
+        for f in fields(cls)
+        if f.init  # Derived fields are not serialized
+    ]
+    source = 'def to_dict(self):\n    return {' + ', '.join(items) + '}\n'
+    namespace = {'_convert': _convert}
+    namespace.update({f'_{t.__name__}': t for t in _FIELD_CONVERSIONS})
+    exec(source, namespace)
+    return namespace['to_dict']
+
+
+# ============================================================================
+# Equality
+# ============================================================================
+
+# Event class -> attrgetter returning the tuple of compared fields
+_KEY_CACHE: Dict[type, Any] = {}
+
+
+def _compare_key(cls: type):
+    """Build (and cache) the key function used by Event.__eq__/__hash__"""
+    key = _KEY_CACHE[cls] = attrgetter(*(f.name for f in fields(cls) if f.compare))
+    return key
+
+
+# Registered event classes; a class's index is its _type_id. Both are
+# filled in by _register_event_types() at the bottom of this module.
+_TYPES_BY_ID: list[type] = []
+_types_by_name: Dict[str, type] = {}
+
+# Read-only name -> class view of the registry
+EVENT_TYPES: Mapping[str, type] = MappingProxyType(_types_by_name)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Event:
     """Base class for all events"""
-    event_id: UUID = field(default_factory=uuid4)
+    event_id: UUID = field(default_factory=_new_event_id)
     timestamp: datetime = field(default_factory=datetime.now)
 
+    # Class name and wire id cached at definition time (ClassVars, so not
+    # fields/slots)
+    _event_name: ClassVar[str] = 'Event'
+    _type_id: ClassVar[int] = -1
+
+    new_id = staticmethod(_new_event_id)
+
+    # The decorators use eq=False so every event shares these: an identity
+    # check first (fan-out hands subscribers the published object itself),
+    # then the same field-by-field comparison dataclasses would generate.
+    def __eq__(self, other):
+        if self is other:
+            return True
+        cls = self.__class__
+        if other.__class__ is not cls:
+            return NotImplemented
+        key = _KEY_CACHE.get(cls) or _compare_key(cls)
+        return key(self) == key(other)
+
+    def __hash__(self):
+        cls = self.__class__
+        key = _KEY_CACHE.get(cls) or _compare_key(cls)
+        return hash(key(self))
+
+    @classmethod
+    def make_batch(cls, rows: Iterable[Dict[str, Any]]) -> list['Event']:
+        """
+        Construct several events that share one timestamp
+
+        Reads the clock once for the whole batch instead of once per event,
+        e.g. for ticks that are published together via publish_multiple.
+
+        Args:
+            rows: Field values for each event (timestamp is supplied)
+
+        Returns:
+            Events of this class, in row order
+        """
+        now = datetime.now()
+        return [cls(timestamp=now, **row) for row in rows]
+
+    def __init_subclass__(cls, **kwargs):
+        # Explicit super(): slots=True rebuilds the class, which breaks the
+        # zero-argument form. Only the name is cached here; wire ids come
+        # from the explicit registry below, so subclasses defined elsewhere
+        # (test doubles, plugins) stay unregistered instead of inheriting
+        # their parent's id.
+        super(Event, cls).__init_subclass__(**kwargs)
+        cls._event_name = cls.__name__
+        cls._type_id = -1
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for serialization"""
-        result = {}
-        for k, v in self.__dict__.items():
-            if isinstance(v, (UUID, datetime)):
-                result[k] = str(v)
-            elif isinstance(v, Decimal):
-                result[k] = float(v)
-            else:
-                result[k] = v
-        return result
+        cls = type(self)
+        try:
+            serialize = _TO_DICT_CACHE[cls]
+        except KeyError:
+            serialize = _TO_DICT_CACHE[cls] = _build_to_dict(cls)
+        return serialize(self)
 
 
 # ============================================================================
 # Market Data Events
 # ============================================================================
 
-@dataclass(frozen=True)
+# Fixed-point scale for integer prices (1e-8, the exchange's smallest tick)
+_PRICE_SCALE = 100_000_000
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class MarketTickEvent(Event):
     """Real-time price tick from exchange"""
     symbol: str = ""
-    price: Decimal = Decimal('0')
-    volume: Decimal = Decimal('0')
+    price: Decimal = _ZERO  # float/int accepted, stored as Decimal
+    volume: Decimal = _ZERO
     bid: Optional[Decimal] = None
     ask: Optional[Decimal] = None
     spread: Optional[Decimal] = None
-
-
-@dataclass(frozen=True)
+    # Float copy of price for numpy-bound consumers; price stays exact
+    price_f: Optional[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        price = self.price
+        if price is None:
+            object.__setattr__(self, 'price_f', None)
+            return
+        if isinstance(price, Decimal):
+            price_f = float(price)
+        else:
+            if isinstance(price, Integral):
+                price = int(price)
+                price_f = float(price)
+                price = Decimal(price)
+            elif isinstance(price, Real):
+                # Take the float copy as given; repr() of a float is its
+                # shortest exact form, e.g. 0.1 -> '0.1'. float() first so
+                # numpy scalars don't repr as 'np.float64(...)'
+                price_f = float(price)
+                price = Decimal(repr(price_f))
+            else:
+                price = Decimal(price)
+                price_f = float(price)
+            object.__setattr__(self, 'price', price)
+        object.__setattr__(self, 'price_f', price_f)
+
+    @property
+    def price_e8(self) -> Optional[int]:
+        """Price in units of 1e-8 for cheap integer compare/hash"""
+        # Computed on demand so tick construction does not pay for it
+        if self.price is None:
+            return None
+        return int(self.price * _PRICE_SCALE)
+
+    @classmethod
+    def from_price_e8(cls, price_e8: int, **kwargs) -> 'MarketTickEvent':
+        """
+        Build a tick from a fixed-point price
+
+        Args:
+            price_e8: Price in units of 1e-8
+            **kwargs: Remaining MarketTickEvent fields
+
+        Returns:
+            MarketTickEvent whose price is exactly price_e8 / 1e8
+        """
+        return cls(price=Decimal(price_e8).scaleb(-8), **kwargs)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class OHLCVEvent(Event):
     """OHLCV candle data"""
     symbol: str = ""
     interval: str = ""  # 1m, 5m, 15m, 1h, 4h, 1d
-    open: Decimal = Decimal('0')
-    high: Decimal = Decimal('0')
-    low: Decimal = Decimal('0')
-    close: Decimal = Decimal('0')
-    volume: Decimal = Decimal('0')
+    open: Decimal = _ZERO
+    high: Decimal = _ZERO
+    low: Decimal = _ZERO
+    close: Decimal = _ZERO
+    volume: Decimal = _ZERO
     trades: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class MarketDataErrorEvent(Event):
     """Market data feed error"""
     symbol: str = ""
@@ -75,21 +310,21 @@ class MarketDataErrorEvent(Event):
 # Trading Signal Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TradingSignalEvent(Event):
     """Trading signal generated by strategy"""
     strategy_name: str = ""
     symbol: str = ""
     side: str = ""  # buy or sell
-    confidence: Decimal = Decimal('0')  # 0.0 to 1.0
+    confidence: Decimal = _ZERO  # 0.0 to 1.0
     reason: str = ""
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class SignalCancelledEvent(Event):
     """Signal cancelled before execution"""
-    signal_id: UUID = field(default_factory=uuid4)
+    signal_id: UUID = field(default_factory=_new_event_id)
     strategy_name: str = ""
     symbol: str = ""
     reason: str = ""
@@ -99,20 +334,20 @@ class SignalCancelledEvent(Event):
 # Trade Execution Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class OrderPlacedEvent(Event):
     """Order placed on exchange"""
     order_id: str = ""
     strategy_name: str = ""
     symbol: str = ""
     side: str = ""
-    quantity: Decimal = Decimal('0')
+    quantity: Decimal = _ZERO
     order_type: str = "market"  # market, limit, stop
     price: Optional[Decimal] = None
     trade_mode: str = "paper"  # paper or live
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TradeExecutedEvent(Event):
     """Trade executed (filled)"""
     trade_id: Optional[UUID] = None
@@ -120,13 +355,13 @@ class TradeExecutedEvent(Event):
     strategy_name: str = ""
     symbol: str = ""
     side: str = ""
-    quantity: Decimal = Decimal('0')
-    price: Decimal = Decimal('0')
-    fee: Decimal = Decimal('0')
+    quantity: Decimal = _ZERO
+    price: Decimal = _ZERO
+    fee: Decimal = _ZERO
     trade_mode: str = "paper"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class OrderCancelledEvent(Event):
     """Order cancelled"""
     order_id: str = ""
@@ -135,7 +370,7 @@ class OrderCancelledEvent(Event):
     reason: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TradeErrorEvent(Event):
     """Trade execution error"""
     order_id: Optional[str] = None
@@ -149,38 +384,38 @@ class TradeErrorEvent(Event):
 # Position Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PositionOpenedEvent(Event):
     """New position opened"""
-    position_id: UUID = field(default_factory=uuid4)
+    position_id: UUID = field(default_factory=_new_event_id)
     strategy_name: str = ""
     symbol: str = ""
-    quantity: Decimal = Decimal('0')
-    entry_price: Decimal = Decimal('0')
+    quantity: Decimal = _ZERO
+    entry_price: Decimal = _ZERO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PositionUpdatedEvent(Event):
     """Position updated (size or value changed)"""
-    position_id: UUID = field(default_factory=uuid4)
+    position_id: UUID = field(default_factory=_new_event_id)
     strategy_name: str = ""
     symbol: str = ""
-    quantity: Decimal = Decimal('0')
-    current_price: Decimal = Decimal('0')
-    unrealized_pnl: Decimal = Decimal('0')
+    quantity: Decimal = _ZERO
+    current_price: Decimal = _ZERO
+    unrealized_pnl: Decimal = _ZERO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PositionClosedEvent(Event):
     """Position closed"""
-    position_id: UUID = field(default_factory=uuid4)
+    position_id: UUID = field(default_factory=_new_event_id)
     strategy_name: str = ""
     symbol: str = ""
-    quantity: Decimal = Decimal('0')
-    entry_price: Decimal = Decimal('0')
-    exit_price: Decimal = Decimal('0')
-    pnl: Decimal = Decimal('0')
-    return_pct: Decimal = Decimal('0')
+    quantity: Decimal = _ZERO
+    entry_price: Decimal = _ZERO
+    exit_price: Decimal = _ZERO
+    pnl: Decimal = _ZERO
+    return_pct: Decimal = _ZERO
     hold_duration: Optional[str] = None
 
 
@@ -188,16 +423,16 @@ class PositionClosedEvent(Event):
 # Portfolio Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PortfolioSnapshotEvent(Event):
     """Portfolio snapshot taken"""
     strategy_name: str = ""
-    total_value: Decimal = Decimal('0')
-    cash: Decimal = Decimal('0')
-    positions_value: Decimal = Decimal('0')
-    unrealized_pnl: Decimal = Decimal('0')
-    realized_pnl: Decimal = Decimal('0')
-    total_return_pct: Decimal = Decimal('0')
+    total_value: Decimal = _ZERO
+    cash: Decimal = _ZERO
+    positions_value: Decimal = _ZERO
+    unrealized_pnl: Decimal = _ZERO
+    realized_pnl: Decimal = _ZERO
+    total_return_pct: Decimal = _ZERO
     num_positions: int = 0
 
 
@@ -205,7 +440,7 @@ class PortfolioSnapshotEvent(Event):
 # Meta-Strategy Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AllocationEvent(Event):
     """Capital allocation changed"""
     allocations: Dict[str, float] = field(default_factory=dict)  # strategy_name -> pct
@@ -213,14 +448,14 @@ class AllocationEvent(Event):
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RebalanceRequestEvent(Event):
     """Request to rebalance portfolio"""
     reason: str = ""
     target_allocations: Optional[Dict[str, float]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RebalanceCompletedEvent(Event):
     """Portfolio rebalancing completed"""
     old_allocations: Dict[str, float] = field(default_factory=dict)
@@ -232,7 +467,7 @@ class RebalanceCompletedEvent(Event):
 # Fork Management Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ForkRequestEvent(Event):
     """Request to create database fork"""
     requesting_agent: str = ""
@@ -241,7 +476,7 @@ class ForkRequestEvent(Event):
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ForkCreatedEvent(Event):
     """Database fork created"""
     fork_id: str = ""
@@ -250,7 +485,7 @@ class ForkCreatedEvent(Event):
     requesting_agent: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ForkCompletedEvent(Event):
     """Fork usage completed, ready for cleanup"""
     fork_id: str = ""
@@ -258,7 +493,7 @@ class ForkCompletedEvent(Event):
     results: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ForkDestroyedEvent(Event):
     """Database fork destroyed"""
     fork_id: str = ""
@@ -269,7 +504,7 @@ class ForkDestroyedEvent(Event):
 # Risk Management Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RiskAlertEvent(Event):
     """Risk threshold warning"""
     alert_type: str = ""  # position_size, daily_loss, drawdown, exposure
@@ -282,7 +517,7 @@ class RiskAlertEvent(Event):
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class EmergencyHaltEvent(Event):
     """Emergency trading halt"""
     reason: str = ""
@@ -290,10 +525,10 @@ class EmergencyHaltEvent(Event):
     affected_strategies: Optional[list[str]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class HaltResumedEvent(Event):
     """Trading resumed after halt"""
-    halt_id: UUID = field(default_factory=uuid4)
+    halt_id: UUID = field(default_factory=_new_event_id)
     reason: str = ""
     resumed_by: str = ""
 
@@ -302,21 +537,21 @@ class HaltResumedEvent(Event):
 # Agent Lifecycle Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AgentStartedEvent(Event):
     """Agent started"""
     agent_name: str = ""
     config: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AgentStoppedEvent(Event):
     """Agent stopped"""
     agent_name: str = ""
     reason: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AgentErrorEvent(Event):
     """Agent error occurred"""
     agent_name: str = ""
@@ -325,7 +560,7 @@ class AgentErrorEvent(Event):
     is_fatal: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AgentHeartbeatEvent(Event):
     """Agent heartbeat (health check)"""
     agent_name: str = ""
@@ -337,10 +572,10 @@ class AgentHeartbeatEvent(Event):
 # Backtest/Simulation Events
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class BacktestStartedEvent(Event):
     """Backtest simulation started"""
-    backtest_id: UUID = field(default_factory=uuid4)
+    backtest_id: UUID = field(default_factory=_new_event_id)
     fork_id: Optional[str] = None
     strategy_name: str = ""
     start_date: datetime = field(default_factory=datetime.now)
@@ -348,10 +583,10 @@ class BacktestStartedEvent(Event):
     initial_capital: Decimal = Decimal('10000')
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class BacktestCompletedEvent(Event):
     """Backtest simulation completed"""
-    backtest_id: UUID = field(default_factory=uuid4)
+    backtest_id: UUID = field(default_factory=_new_event_id)
     strategy_name: str = ""
     results: Dict[str, Any] = field(default_factory=dict)
 
@@ -360,59 +595,95 @@ class BacktestCompletedEvent(Event):
 # Event Type Registry
 # ============================================================================
 
-# Mapping of event type names to classes for deserialization
-EVENT_TYPES = {
+def _register_event_types(classes: Iterable[type]) -> None:
+    """
+    Fill EVENT_TYPES and the wire id table
+
+    Ids follow the order of `classes`, so append new event types at the end;
+    reordering changes the ids seen by other processes.
+
+    Raises:
+        ValueError: If two classes share a name
+    """
+    for cls in classes:
+        name = cls._event_name
+        if name in _types_by_name:
+            raise ValueError(f"Duplicate event type name: {name}")
+        cls._type_id = len(_TYPES_BY_ID)
+        _TYPES_BY_ID.append(cls)
+        _types_by_name[name] = cls
+
+
+# Event type name -> class (for deserialization) and integer wire ids
+_register_event_types((
     # Market Data
-    'MarketTickEvent': MarketTickEvent,
-    'OHLCVEvent': OHLCVEvent,
-    'MarketDataErrorEvent': MarketDataErrorEvent,
+    MarketTickEvent,
+    OHLCVEvent,
+    MarketDataErrorEvent,
 
     # Trading Signals
-    'TradingSignalEvent': TradingSignalEvent,
-    'SignalCancelledEvent': SignalCancelledEvent,
+    TradingSignalEvent,
+    SignalCancelledEvent,
 
     # Trade Execution
-    'OrderPlacedEvent': OrderPlacedEvent,
-    'TradeExecutedEvent': TradeExecutedEvent,
-    'OrderCancelledEvent': OrderCancelledEvent,
-    'TradeErrorEvent': TradeErrorEvent,
+    OrderPlacedEvent,
+    TradeExecutedEvent,
+    OrderCancelledEvent,
+    TradeErrorEvent,
 
     # Positions
-    'PositionOpenedEvent': PositionOpenedEvent,
-    'PositionUpdatedEvent': PositionUpdatedEvent,
-    'PositionClosedEvent': PositionClosedEvent,
+    PositionOpenedEvent,
+    PositionUpdatedEvent,
+    PositionClosedEvent,
 
     # Portfolio
-    'PortfolioSnapshotEvent': PortfolioSnapshotEvent,
+    PortfolioSnapshotEvent,
 
     # Meta-Strategy
-    'AllocationEvent': AllocationEvent,
-    'RebalanceRequestEvent': RebalanceRequestEvent,
-    'RebalanceCompletedEvent': RebalanceCompletedEvent,
+    AllocationEvent,
+    RebalanceRequestEvent,
+    RebalanceCompletedEvent,
 
     # Fork Management
-    'ForkRequestEvent': ForkRequestEvent,
-    'ForkCreatedEvent': ForkCreatedEvent,
-    'ForkCompletedEvent': ForkCompletedEvent,
-    'ForkDestroyedEvent': ForkDestroyedEvent,
+    ForkRequestEvent,
+    ForkCreatedEvent,
+    ForkCompletedEvent,
+    ForkDestroyedEvent,
 
     # Risk Management
-    'RiskAlertEvent': RiskAlertEvent,
-    'EmergencyHaltEvent': EmergencyHaltEvent,
-    'HaltResumedEvent': HaltResumedEvent,
+    RiskAlertEvent,
+    EmergencyHaltEvent,
+    HaltResumedEvent,
 
     # Agent Lifecycle
-    'AgentStartedEvent': AgentStartedEvent,
-    'AgentStoppedEvent': AgentStoppedEvent,
-    'AgentErrorEvent': AgentErrorEvent,
-    'AgentHeartbeatEvent': AgentHeartbeatEvent,
+    AgentStartedEvent,
+    AgentStoppedEvent,
+    AgentErrorEvent,
+    AgentHeartbeatEvent,
 
     # Backtest
-    'BacktestStartedEvent': BacktestStartedEvent,
-    'BacktestCompletedEvent': BacktestCompletedEvent,
-}
+    BacktestStartedEvent,
+    BacktestCompletedEvent,
+))
 
 
 def get_event_type(event: Event) -> str:
     """Get the event type name from an event instance"""
-    return event.__class__.__name__
+    return event._event_name
+
+
+def event_type_id(event: Event) -> int:
+    """Get the integer wire id of an event's type"""
+    return event._type_id
+
+
+def get_event_class(type_id: int) -> type:
+    """
+    Resolve an integer wire id back to its event class
+
+    Raises:
+        IndexError: If no event type has this id
+    """
+    if type_id < 0:
+        raise IndexError(f"Invalid event type id: {type_id}")
+    return _TYPES_BY_ID[type_id]
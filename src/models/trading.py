@@ -10,11 +10,17 @@ from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
 
 
+# Shared constants; Decimal is immutable, and Decimal * Decimal skips the
+# int conversion that Decimal * 100 pays on every call
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+
+
 # ============================================================================
 # Position Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Trading position (open or closed)
@@ -44,19 +50,25 @@ class Position:
             return self.entry_value
         return self.quantity * self.current_price
 
-    def update_price(self, new_price: Decimal) -> None:
-        """Update current price and recalculate PnL"""
+    def update_price(self, new_price: Decimal, updated_at: Optional[datetime] = None) -> None:
+        """
+        Update current price and recalculate PnL
+
+        Args:
+            new_price: Latest market price
+            updated_at: Update time (default: now); batch updates pass one shared time
+        """
         self.current_price = new_price
         self.unrealized_pnl = (new_price - self.entry_price) * self.quantity
-        self.updated_at = datetime.now()
+        self.updated_at = updated_at if updated_at is not None else datetime.now()
 
     def calculate_return_pct(self) -> Decimal:
         """Calculate return percentage"""
         if self.entry_price == 0:
-            return Decimal('0')
+            return _ZERO
         if self.current_price is None:
-            return Decimal('0')
-        return ((self.current_price - self.entry_price) / self.entry_price) * 100
+            return _ZERO
+        return ((self.current_price - self.entry_price) / self.entry_price) * _HUNDRED
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -74,7 +86,7 @@ class Position:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosedPosition:
     """
     Closed trading position with realized PnL
@@ -97,8 +109,9 @@ class ClosedPosition:
     @classmethod
     def from_position(cls, position: Position, exit_price: Decimal, closed_at: datetime) -> 'ClosedPosition':
         """Create ClosedPosition from an open Position"""
-        pnl = (exit_price - position.entry_price) * position.quantity
-        return_pct = ((exit_price - position.entry_price) / position.entry_price) * 100
+        price_change = exit_price - position.entry_price
+        pnl = price_change * position.quantity
+        return_pct = (price_change / position.entry_price) * _HUNDRED
         hold_duration = str(closed_at - position.opened_at)
 
         return cls(
@@ -138,7 +151,7 @@ class ClosedPosition:
 # Trade Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Individual trade execution
@@ -207,7 +220,7 @@ class Portfolio:
     @property
     def positions_value(self) -> Decimal:
         """Total value of all open positions"""
-        return sum(pos.current_value for pos in self.positions.values())
+        return sum((pos.current_value for pos in self.positions.values()), _ZERO)
 
     @property
     def total_value(self) -> Decimal:
@@ -217,15 +230,15 @@ class Portfolio:
     @property
     def unrealized_pnl(self) -> Decimal:
         """Total unrealized PnL from open positions"""
-        return sum(
+        return sum((
             pos.unrealized_pnl for pos in self.positions.values()
             if pos.unrealized_pnl is not None
-        )
+        ), _ZERO)
 
     @property
     def realized_pnl(self) -> Decimal:
         """Total realized PnL from closed positions"""
-        return sum(pos.pnl for pos in self.closed_positions)
+        return sum((pos.pnl for pos in self.closed_positions), _ZERO)
 
     @property
     def total_pnl(self) -> Decimal:
@@ -235,9 +248,7 @@ class Portfolio:
     @property
     def total_return_pct(self) -> Decimal:
         """Total return percentage"""
-        if self.initial_capital == 0:
-            return Decimal('0')
-        return ((self.total_value - self.initial_capital) / self.initial_capital) * 100
+        return self._return_pct(self.total_value)
 
     @property
     def num_positions(self) -> int:
@@ -247,9 +258,22 @@ class Portfolio:
     @property
     def exposure_pct(self) -> Decimal:
         """Portfolio exposure percentage"""
-        if self.total_value == 0:
-            return Decimal('0')
-        return (self.positions_value / self.total_value) * 100
+        # One walk over the positions; total_value would repeat it
+        positions_value = self.positions_value
+        return self._exposure_pct(positions_value, self.cash + positions_value)
+
+    def _return_pct(self, total_value: Decimal) -> Decimal:
+        """Return percentage for a given total value"""
+        if self.initial_capital == 0:
+            return _ZERO
+        return ((total_value - self.initial_capital) / self.initial_capital) * _HUNDRED
+
+    @staticmethod
+    def _exposure_pct(positions_value: Decimal, total_value: Decimal) -> Decimal:
+        """Exposure percentage for given position and total values"""
+        if total_value == 0:
+            return _ZERO
+        return (positions_value / total_value) * _HUNDRED
 
     def add_position(self, position: Position) -> None:
         """Add or update a position"""
@@ -279,24 +303,39 @@ class Portfolio:
 
     def update_prices(self, prices: Dict[str, Decimal]) -> None:
         """Update current prices for all positions"""
-        for symbol, position in self.positions.items():
-            if symbol in prices:
-                position.update_price(prices[symbol])
+        # One timestamp for the whole batch, as with Event.make_batch
+        now = datetime.now()
+        positions = self.positions
+        if len(prices) < len(positions):
+            # A few ticks against a large book: only touch those symbols
+            for symbol, price in prices.items():
+                position = positions.get(symbol)
+                if position is not None:
+                    position.update_price(price, now)
+        else:
+            for symbol, position in positions.items():
+                if symbol in prices:
+                    position.update_price(prices[symbol], now)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        # Each aggregate walks the positions; compute them once here
+        positions_value = self.positions_value
+        total_value = self.cash + positions_value
+        unrealized_pnl = self.unrealized_pnl
+        realized_pnl = self.realized_pnl
         return {
             'strategy_name': self.strategy_name,
             'initial_capital': float(self.initial_capital),
             'cash': float(self.cash),
-            'positions_value': float(self.positions_value),
-            'total_value': float(self.total_value),
-            'unrealized_pnl': float(self.unrealized_pnl),
-            'realized_pnl': float(self.realized_pnl),
-            'total_pnl': float(self.total_pnl),
-            'total_return_pct': float(self.total_return_pct),
+            'positions_value': float(positions_value),
+            'total_value': float(total_value),
+            'unrealized_pnl': float(unrealized_pnl),
+            'realized_pnl': float(realized_pnl),
+            'total_pnl': float(realized_pnl + unrealized_pnl),
+            'total_return_pct': float(self._return_pct(total_value)),
             'num_positions': self.num_positions,
-            'exposure_pct': float(self.exposure_pct),
+            'exposure_pct': float(self._exposure_pct(positions_value, total_value)),
             'positions': {symbol: pos.to_dict() for symbol, pos in self.positions.items()},
             'num_trades': len(self.trades),
             'num_closed_positions': len(self.closed_positions)
@@ -307,7 +346,7 @@ class Portfolio:
 # Order Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Trading order (limit, market, stop)
@@ -322,7 +361,7 @@ class Order:
     quantity: Decimal
     price: Optional[Decimal] = None  # For limit/stop orders
     status: str = "pending"  # pending, filled, cancelled, error
-    filled_quantity: Decimal = Decimal('0')
+    filled_quantity: Decimal = _ZERO
     filled_price: Optional[Decimal] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
@@ -337,7 +376,7 @@ class Order:
     @property
     def is_partial_fill(self) -> bool:
         """Check if order is partially filled"""
-        return Decimal('0') < self.filled_quantity < self.quantity
+        return _ZERO < self.filled_quantity < self.quantity
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -363,7 +402,7 @@ class Order:
 # Performance Metrics
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StrategyMetrics:
     """
     Performance metrics for a trading strategy
@@ -373,16 +412,16 @@ class StrategyMetrics:
     total_trades: int = 0
     winning_trades: int = 0
     losing_trades: int = 0
-    win_rate: Decimal = Decimal('0')
-    total_pnl: Decimal = Decimal('0')
-    avg_win: Decimal = Decimal('0')
-    avg_loss: Decimal = Decimal('0')
-    profit_factor: Decimal = Decimal('0')
+    win_rate: Decimal = _ZERO
+    total_pnl: Decimal = _ZERO
+    avg_win: Decimal = _ZERO
+    avg_loss: Decimal = _ZERO
+    profit_factor: Decimal = _ZERO
     sharpe_ratio: Optional[Decimal] = None
-    max_drawdown: Decimal = Decimal('0')
-    current_drawdown: Decimal = Decimal('0')
+    max_drawdown: Decimal = _ZERO
+    current_drawdown: Decimal = _ZERO
     volatility: Optional[Decimal] = None
-    total_fees: Decimal = Decimal('0')
+    total_fees: Decimal = _ZERO
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -5,16 +5,22 @@ Provides:
 - REST endpoints for system state
 - WebSocket for real-time updates
 """
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 import asyncio
+import json
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
@@ -80,15 +86,13 @@ async def dashboard():
     return FileResponse(str(static_dir / "index.html"))
 
 
-from src.core.database import get_db_manager_sync
+from src.core.database import DatabaseManager, get_db_manager
 
 
 @app.get("/api/portfolio")
-async def get_portfolio():
+async def get_portfolio(db: DatabaseManager = Depends(get_db_manager)):
     """Get current portfolio summary"""
     try:
-        db = get_db_manager_sync()
-
         # Check if database is initialized
         if not db.is_initialized:
             return {
@@ -139,11 +143,9 @@ async def get_portfolio():
 
 
 @app.get("/api/trades/recent")
-async def get_recent_trades(limit: int = 50):
+async def get_recent_trades(limit: int = 50, db: DatabaseManager = Depends(get_db_manager)):
     """Get recent trades"""
     try:
-        db = get_db_manager_sync()
-
         # Check if database is initialized
         if not db.is_initialized:
             return {
@@ -176,11 +178,9 @@ async def get_recent_trades(limit: int = 50):
 
 
 @app.get("/api/forks/active")
-async def get_active_forks():
+async def get_active_forks(db: DatabaseManager = Depends(get_db_manager)):
     """Get active database forks"""
     try:
-        db = get_db_manager_sync()
-
         # Check if database is initialized
         if not db.is_initialized:
             return {
@@ -227,6 +227,18 @@ from src.models.events import (
 )
 
 
+def _encode_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a WebSocket message to JSON text
+
+    Uses orjson when installed; otherwise the same compact stdlib
+    encoding that WebSocket.send_json produces.
+    """
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -264,11 +276,11 @@ async def websocket_endpoint(websocket: WebSocket):
                 for event_type, queue in queues.items():
                     if not queue.empty():
                         event = await queue.get()
-                        await websocket.send_json({
+                        await websocket.send_text(_encode_message({
                             'type': event_type,
                             'data': event.to_dict(),
                             'timestamp': datetime.now().isoformat()
-                        })
+                        }))
 
                 await asyncio.sleep(0.1)  # 100ms poll
 
@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration
+"""
+import sys
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # Optional: tests fall back to the default asyncio loop
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != 'win32':
+    @pytest.fixture(scope='session')
+    def event_loop_policy():
+        """Run every async test on uvloop when it is installed"""
+        return uvloop.EventLoopPolicy()
@@ -0,0 +1,124 @@
+"""
+Shared test helpers
+"""
+import asyncio
+from collections import Counter
+
+
+async def drain_one(queue: asyncio.Queue, timeout: float = 1.0):
+    """
+    Get one item from a queue, failing if nothing arrives in time
+
+    Args:
+        queue: Queue to read from
+        timeout: Seconds to wait before raising TimeoutError
+
+    Returns:
+        The next item from the queue
+    """
+    async with asyncio.timeout(timeout):
+        return await queue.get()
+
+
+async def drain(event_bus, event_type, timeout: float = 1.0, poll_interval: float = 0.001):
+    """
+    Wait until subscribers have taken every queued event of a type
+
+    Only guarantees that the queues are empty, not that consumers have
+    finished handling what they took: a consumer that suspends while
+    processing an event may still be busy when this returns. Consumers
+    that handle events without awaiting in between are done by then.
+
+    Args:
+        event_bus: EventBus whose subscriber queues to watch
+        event_type: Event class whose queues should be drained
+        timeout: Seconds to wait before raising TimeoutError
+        poll_interval: Seconds to sleep between checks
+    """
+    queues = event_bus._subs.get(event_type, ())
+    async with asyncio.timeout(timeout):
+        while any(not queue.empty() for queue in queues):
+            await asyncio.sleep(poll_interval)
+
+
+class EventBusStub:
+    """
+    Lightweight stand-in for EventBus
+
+    Hands out plain queues and records published events instead of
+    delivering them, without any unittest.mock machinery.
+    """
+
+    def __init__(self):
+        self.published: list = []
+        self._queues: dict = {}
+
+    def subscribe(self, event_type) -> asyncio.Queue:
+        """Return the (shared) queue for an event type"""
+        return self._queues.setdefault(event_type, asyncio.Queue())
+
+    async def publish(self, event) -> None:
+        """Record an event"""
+        self.published.append(event)
+
+
+class FakeConnection:
+    """
+    In-memory stand-in for an asyncpg connection
+
+    Returns canned rows and counts queries per method. Pass an exception
+    instance as fetch/fetchrow to have that query raise it.
+    """
+
+    def __init__(self, fetch=None, fetchrow=None):
+        self._fetch = [] if fetch is None else fetch
+        self._fetchrow = fetchrow
+        self.calls: Counter = Counter()
+
+    def _result(self, method: str, result):
+        self.calls[method] += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def fetch(self, query, *args):
+        """Return the canned rows"""
+        return self._result('fetch', self._fetch)
+
+    async def fetchrow(self, query, *args):
+        """Return the canned row"""
+        return self._result('fetchrow', self._fetchrow)
+
+    async def execute(self, query, *args):
+        """Record a statement"""
+        return self._result('execute', None)
+
+
+class FakeDbManager:
+    """
+    In-memory stand-in for DatabaseManager
+
+    Always hands out the same FakeConnection. Patch get_db_manager with
+    `provider` (or register it as a FastAPI dependency override) to
+    inject it.
+    """
+
+    is_initialized = True
+
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+        self.get_connection_called = False
+        self.released = 0
+
+    async def provider(self) -> 'FakeDbManager':
+        """Async replacement for get_db_manager()"""
+        return self
+
+    async def get_connection(self) -> FakeConnection:
+        """Return the shared connection"""
+        self.get_connection_called = True
+        return self.conn
+
+    async def release_connection(self, conn: FakeConnection) -> None:
+        """Count the release"""
+        self.released += 1
@@ -15,6 +15,7 @@ from src.models.events import (
     AgentStoppedEvent,
     AgentHeartbeatEvent
 )
+from tests.helpers import drain_one
 
 
 # ============================================================================
@@ -113,7 +114,7 @@ class TestBaseAgent:
         task = asyncio.create_task(agent.run())
 
         # Should receive started event
-        started = await asyncio.wait_for(started_queue.get(), timeout=1.0)
+        started = await drain_one(started_queue)
         assert isinstance(started, AgentStartedEvent)
         assert started.agent_name == "test_agent"
 
@@ -121,7 +122,7 @@ class TestBaseAgent:
         await asyncio.wait_for(task, timeout=2.0)
 
         # Should receive stopped event
-        stopped = await asyncio.wait_for(stopped_queue.get(), timeout=1.0)
+        stopped = await drain_one(stopped_queue)
         assert isinstance(stopped, AgentStoppedEvent)
         assert stopped.agent_name == "test_agent"
 
@@ -138,7 +139,7 @@ class TestBaseAgent:
         task = asyncio.create_task(agent.run())
 
         # Should receive at least one heartbeat
-        heartbeat = await asyncio.wait_for(heartbeat_queue.get(), timeout=1.0)
+        heartbeat = await drain_one(heartbeat_queue)
         assert isinstance(heartbeat, AgentHeartbeatEvent)
         assert heartbeat.agent_name == "test_agent"
         assert heartbeat.status == 'running'
@@ -164,7 +165,7 @@ class TestBaseAgent:
         await agent.publish(event)
 
         # Should receive the event
-        received = await asyncio.wait_for(queue.get(), timeout=1.0)
+        received = await drain_one(queue)
         assert received == event
 
     async def test_agent_subscribe(self):
@@ -184,7 +185,7 @@ class TestBaseAgent:
         await event_bus.publish(event)
 
         # Should receive the event
-        received = await asyncio.wait_for(queue.get(), timeout=1.0)
+        received = await drain_one(queue)
         assert received == event
 
     async def test_agent_status(self):
@@ -12,6 +12,7 @@ from src.models.events import (
     AllocationEvent,
     MarketTickEvent
 )
+from tests.helpers import drain_one
 
 
 @pytest.fixture
@@ -135,7 +136,7 @@ async def test_execution_agent_executes_buy_signal(event_bus, execution_agent):
         await event_bus.publish(signal)
 
         # Wait for trade execution
-        trade = await asyncio.wait_for(trade_queue.get(), timeout=2.0)
+        trade = await drain_one(trade_queue, timeout=2.0)
 
         # Verify trade
         assert isinstance(trade, TradeExecutedEvent)
@@ -193,7 +194,7 @@ async def test_execution_agent_executes_sell_signal(event_bus, execution_agent):
         await event_bus.publish(buy_signal)
 
         # Wait for buy execution
-        buy_trade = await asyncio.wait_for(trade_queue.get(), timeout=2.0)
+        buy_trade = await drain_one(trade_queue, timeout=2.0)
         await asyncio.sleep(0.1)
 
         # Update price
@@ -216,7 +217,7 @@ async def test_execution_agent_executes_sell_signal(event_bus, execution_agent):
         await event_bus.publish(sell_signal)
 
         # Wait for sell execution
-        sell_trade = await asyncio.wait_for(trade_queue.get(), timeout=2.0)
+        sell_trade = await drain_one(trade_queue, timeout=2.0)
 
         # Verify sell trade
         assert sell_trade.side == 'sell'
@@ -264,7 +265,7 @@ async def test_execution_agent_ignores_signals_without_allocation(event_bus, exe
 
         # Should not execute trade
         with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(trade_queue.get(), timeout=0.5)
+            await drain_one(trade_queue, timeout=0.5)
 
     finally:
         agent_task.cancel()
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from src.agents.fork_manager import ForkManagerAgent
 from src.models.events import ForkRequestEvent, ForkCreatedEvent, ForkCompletedEvent
 from src.core.event_bus import EventBus
+from tests.helpers import drain_one
 
 
 @pytest.fixture
@@ -67,7 +68,7 @@ async def test_fork_creation_success(event_bus, fork_manager):
 
             # Verify fork created event published
             try:
-                event = await asyncio.wait_for(queue.get(), timeout=1.0)
+                event = await drain_one(queue)
                 assert isinstance(event, ForkCreatedEvent)
                 assert event.fork_id == 'fork-123'
                 assert event.service_id == 'fork-123'
@@ -8,6 +8,7 @@ from decimal import Decimal
 from src.agents.market_data import MarketDataAgent
 from src.core.event_bus import EventBus
 from src.models.events import MarketTickEvent
+from tests.helpers import drain_one
 
 
 @pytest.fixture
@@ -66,7 +67,7 @@ async def test_market_data_publishes_events(event_bus, market_data_agent):
 
         # Wait for event
         try:
-            event = await asyncio.wait_for(queue.get(), timeout=2.0)
+            event = await drain_one(queue, timeout=2.0)
 
             # Verify event
             assert isinstance(event, MarketTickEvent)
@@ -121,7 +122,7 @@ async def test_market_data_handles_multiple_symbols(event_bus):
             # Should receive events for both symbols
             events = []
             for _ in range(2):
-                event = await asyncio.wait_for(queue.get(), timeout=2.0)
+                event = await drain_one(queue, timeout=2.0)
                 events.append(event)
 
             assert len(events) == 2
@@ -9,6 +9,7 @@ from decimal import Decimal
 from src.agents.meta_strategy import MetaStrategyAgent
 from src.models.events import AllocationEvent
 from src.core.event_bus import EventBus
+from tests.helpers import drain_one
 
 
 @pytest.fixture
@@ -42,7 +43,7 @@ async def test_initial_equal_allocation(event_bus, meta_strategy_agent):
 
     # Should publish allocation event
     try:
-        event = await asyncio.wait_for(queue.get(), timeout=1.0)
+        event = await drain_one(queue)
         assert isinstance(event, AllocationEvent)
         assert len(event.allocations) == 3
         assert event.reason == "Initial equal weighting allocation"
@@ -179,7 +180,7 @@ async def test_reallocation_threshold():
 
         # Should not publish event (change is < 5%)
         try:
-            await asyncio.wait_for(queue.get(), timeout=0.1)
+            await drain_one(queue, timeout=0.1)
             pytest.fail("Should not publish allocation event for small changes")
         except asyncio.TimeoutError:
             pass  # Expected
@@ -220,7 +221,7 @@ async def test_publishes_allocation_event():
 
     # Verify event published
     try:
-        event = await asyncio.wait_for(queue.get(), timeout=1.0)
+        event = await drain_one(queue)
         assert isinstance(event, AllocationEvent)
         assert 'momentum' in event.allocations
         assert 'macd' in event.allocations
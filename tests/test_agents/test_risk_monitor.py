@@ -3,7 +3,7 @@ Tests for Risk Monitor Agent
 """
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from decimal import Decimal
 from datetime import datetime, timedelta
 
@@ -15,6 +15,7 @@ from src.models.events import (
     MarketTickEvent
 )
 from src.core.event_bus import EventBus
+from tests.helpers import FakeConnection, FakeDbManager, drain_one
 
 
 @pytest.fixture
@@ -80,7 +81,7 @@ async def test_position_size_violation(event_bus, risk_monitor):
 
         # Should publish critical alert
         try:
-            alert = await asyncio.wait_for(queue.get(), timeout=1.0)
+            alert = await drain_one(queue)
             assert isinstance(alert, RiskAlertEvent)
             assert alert.severity == 'critical'
             assert alert.risk_type == 'position_size'
@@ -112,7 +113,7 @@ async def test_position_size_warning(event_bus, risk_monitor):
 
         # Should publish warning alert
         try:
-            alert = await asyncio.wait_for(queue.get(), timeout=1.0)
+            alert = await drain_one(queue)
             assert isinstance(alert, RiskAlertEvent)
             assert alert.severity == 'warning'
             assert alert.risk_type == 'position_size'
@@ -140,7 +141,7 @@ async def test_daily_loss_limit_breach(event_bus, risk_monitor):
 
         # Should publish halt event
         try:
-            halt = await asyncio.wait_for(queue.get(), timeout=1.0)
+            halt = await drain_one(queue)
             assert isinstance(halt, EmergencyHaltEvent)
             assert halt.severity == 'critical'
             assert 'daily loss' in halt.reason.lower()
@@ -167,7 +168,7 @@ async def test_daily_loss_warning(event_bus, risk_monitor):
 
         # Should publish warning
         try:
-            alert = await asyncio.wait_for(queue.get(), timeout=1.0)
+            alert = await drain_one(queue)
             assert isinstance(alert, RiskAlertEvent)
             assert alert.severity == 'warning'
             assert alert.risk_type == 'daily_loss'
@@ -185,16 +186,13 @@ async def test_exposure_limit_check(event_bus, risk_monitor):
     risk_monitor.current_prices['ETHUSDT'] = Decimal('3000')
 
     # Mock database positions
-    mock_conn = AsyncMock()
-    mock_conn.fetch.return_value = [
+    db = FakeDbManager(FakeConnection(fetch=[
         {'symbol': 'BTCUSDT', 'total_quantity': Decimal('0.15')},  # 7500
         {'symbol': 'ETHUSDT', 'total_quantity': Decimal('1.0')}    # 3000
-    ]
+    ]))
     # Total exposure: 10500 = 105% of 10000 portfolio (exceeds 80% limit)
 
-    with patch('src.agents.risk_monitor.get_db_manager') as mock_db:
-        mock_db.return_value.get_connection.return_value = mock_conn
-        mock_db.return_value.release_connection = AsyncMock()
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
 
         with patch.object(risk_monitor, '_get_current_portfolio_value',
                          return_value=Decimal('10000')):
@@ -202,7 +200,7 @@ async def test_exposure_limit_check(event_bus, risk_monitor):
 
             # Should publish critical alert
             try:
-                alert = await asyncio.wait_for(queue.get(), timeout=1.0)
+                alert = await drain_one(queue)
                 assert isinstance(alert, RiskAlertEvent)
                 assert alert.severity == 'critical'
                 assert alert.risk_type == 'exposure'
@@ -216,24 +214,21 @@ async def test_strategy_drawdown_limit(event_bus, risk_monitor):
     queue = event_bus.subscribe(RiskAlertEvent)
 
     # Mock database with strategy performance
-    mock_conn = AsyncMock()
-    mock_conn.fetch.return_value = [
+    db = FakeDbManager(FakeConnection(fetch=[
         {
             'strategy_name': 'momentum',
             'total_pnl': Decimal('-600'),
             'max_drawdown': Decimal('-12.0')  # Exceeds 10% limit
         }
-    ]
+    ]))
 
-    with patch('src.agents.risk_monitor.get_db_manager') as mock_db:
-        mock_db.return_value.get_connection.return_value = mock_conn
-        mock_db.return_value.release_connection = AsyncMock()
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
 
         await risk_monitor._check_strategy_drawdowns()
 
         # Should publish critical alert
         try:
-            alert = await asyncio.wait_for(queue.get(), timeout=1.0)
+            alert = await drain_one(queue)
             assert isinstance(alert, RiskAlertEvent)
             assert alert.severity == 'critical'
             assert alert.risk_type == 'strategy_drawdown'
@@ -314,15 +309,14 @@ async def test_get_portfolio_value(risk_monitor):
     risk_monitor.current_prices['BTCUSDT'] = Decimal('50000')
 
     # Mock database
-    mock_conn = AsyncMock()
-    mock_conn.fetchrow.return_value = {'net_cash': Decimal('-5000')}  # Spent 5000
-    mock_conn.fetch.return_value = [
-        {'symbol': 'BTCUSDT', 'total_quantity': Decimal('0.12')}  # 0.12 * 50000 = 6000
-    ]
+    db = FakeDbManager(FakeConnection(
+        fetchrow={'net_cash': Decimal('-5000')},  # Spent 5000
+        fetch=[
+            {'symbol': 'BTCUSDT', 'total_quantity': Decimal('0.12')}  # 0.12 * 50000 = 6000
+        ]
+    ))
 
-    with patch('src.agents.risk_monitor.get_db_manager') as mock_db:
-        mock_db.return_value.get_connection.return_value = mock_conn
-        mock_db.return_value.release_connection = AsyncMock()
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
 
         value = await risk_monitor._get_current_portfolio_value()
 
@@ -330,6 +324,8 @@ async def test_get_portfolio_value(risk_monitor):
         # Positions: 6000
         # Total: 11000
         assert value == Decimal('11000')
+        assert db.get_connection_called
+        assert db.released == 1
 
 
 @pytest.mark.asyncio
@@ -347,14 +343,11 @@ async def test_handles_missing_price_data(risk_monitor):
     # No prices set
     risk_monitor.current_prices = {}
 
-    mock_conn = AsyncMock()
-    mock_conn.fetch.return_value = [
+    db = FakeDbManager(FakeConnection(fetch=[
         {'symbol': 'BTCUSDT', 'total_quantity': Decimal('0.1')}
-    ]
+    ]))
 
-    with patch('src.agents.risk_monitor.get_db_manager') as mock_db:
-        mock_db.return_value.get_connection.return_value = mock_conn
-        mock_db.return_value.release_connection = AsyncMock()
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
 
         with patch.object(risk_monitor, '_get_current_portfolio_value',
                          return_value=Decimal('10000')):
@@ -365,13 +358,117 @@ async def test_handles_missing_price_data(risk_monitor):
 @pytest.mark.asyncio
 async def test_handles_database_errors(risk_monitor):
     """Test graceful handling of database errors"""
-    mock_conn = AsyncMock()
-    mock_conn.fetch.side_effect = Exception("Database error")
+    db = FakeDbManager(FakeConnection(fetch=Exception("Database error")))
 
-    with patch('src.agents.risk_monitor.get_db_manager') as mock_db:
-        mock_db.return_value.get_connection.return_value = mock_conn
-        mock_db.return_value.release_connection = AsyncMock()
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
 
         # Should not crash on database error
         await risk_monitor._check_exposure()
         await risk_monitor._check_strategy_drawdowns()
+
+
+@pytest.mark.asyncio
+async def test_alert_coalesces_duplicates(event_bus, risk_monitor):
+    """Test identical alerts within the cooldown window are published once"""
+    queue = event_bus.subscribe(RiskAlertEvent)
+
+    trade = TradeExecutedEvent(
+        strategy_name='momentum',
+        symbol='BTCUSDT',
+        side='buy',
+        quantity=Decimal('0.05'),
+        price=Decimal('50000'),  # 25% of 10000 - exceeds 20% limit
+        fee=Decimal('2.5'),
+        order_id='test-order-3'
+    )
+
+    with patch.object(risk_monitor, '_get_current_portfolio_value',
+                     return_value=Decimal('10000')), \
+         patch.object(risk_monitor, '_check_exposure', new=AsyncMock()):
+        await risk_monitor._check_trade_risk(trade)
+        await risk_monitor._check_trade_risk(trade)
+
+    # Second breach is coalesced into the first alert
+    assert queue.qsize() == 1
+    alert = queue.get_nowait()
+    assert alert.alert_type == 'position_size'
+    assert alert.severity == 'critical'
+
+
+@pytest.mark.asyncio
+async def test_portfolio_value_is_memoized(risk_monitor):
+    """Test portfolio value hits the database once across consecutive checks"""
+    risk_monitor.current_prices['BTCUSDT'] = Decimal('50000')
+    risk_monitor.daily_start_value = Decimal('11000')
+    risk_monitor.daily_start_time = datetime.now()
+
+    db = FakeDbManager(FakeConnection(
+        fetchrow={'net_cash': Decimal('-5000')},
+        fetch=[{'symbol': 'BTCUSDT', 'total_quantity': Decimal('0.12')}]
+    ))
+
+    trade = TradeExecutedEvent(
+        strategy_name='momentum',
+        symbol='BTCUSDT',
+        side='buy',
+        quantity=Decimal('0.001'),
+        price=Decimal('50000'),
+        fee=Decimal('0.05'),
+        order_id='test-order-4'
+    )
+
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
+        await risk_monitor._check_position_size(trade)
+        await risk_monitor._check_daily_loss()
+        assert await risk_monitor._get_current_portfolio_value() == Decimal('11000')
+        assert db.conn.calls['fetchrow'] == 1
+
+        # Price ticks adjust the cached value without a round-trip
+        risk_monitor._update_price('BTCUSDT', Decimal('51000'))
+        assert await risk_monitor._get_current_portfolio_value() == Decimal('11120')
+        assert db.conn.calls['fetchrow'] == 1
+
+        # A trade invalidates the cache; its own size check re-reads once
+        with patch.object(risk_monitor, '_check_exposure', new=AsyncMock()):
+            await risk_monitor._check_trade_risk(trade)
+        assert db.conn.calls['fetchrow'] == 2
+        assert await risk_monitor._get_current_portfolio_value() == Decimal('11120')
+        assert db.conn.calls['fetchrow'] == 2
+
+
+@pytest.mark.asyncio
+async def test_portfolio_value_read_racing_a_trade_is_not_cached(risk_monitor):
+    """Test a read in flight when a trade lands does not store its stale value"""
+    gate = asyncio.Event()
+
+    class GatedConnection(FakeConnection):
+        async def fetchrow(self, query, *args):
+            await gate.wait()
+            return await super().fetchrow(query, *args)
+
+    db = FakeDbManager(GatedConnection(fetchrow={'net_cash': Decimal('0')}))
+
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
+        read = asyncio.create_task(risk_monitor._get_current_portfolio_value())
+        await asyncio.sleep(0)
+
+        risk_monitor._invalidate_portfolio_value()
+        gate.set()
+        assert await read == Decimal('10000')
+
+        # The pre-trade result was discarded, so this read goes to the database
+        await risk_monitor._get_current_portfolio_value()
+        assert db.conn.calls['fetchrow'] == 2
+
+
+@pytest.mark.asyncio
+async def test_portfolio_value_cache_expires(risk_monitor):
+    """Test the cached portfolio value is re-read once its TTL passes"""
+    risk_monitor.portfolio_value_ttl_seconds = 0.0
+    db = FakeDbManager(FakeConnection(fetchrow={'net_cash': Decimal('0')}))
+
+    with patch('src.agents.risk_monitor.get_db_manager', db.provider):
+        await risk_monitor._get_current_portfolio_value()
+        await risk_monitor._get_current_portfolio_value()
+
+    assert db.conn.calls['fetchrow'] == 2
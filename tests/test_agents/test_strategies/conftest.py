@@ -0,0 +1,16 @@
+"""
+Shared fixtures for strategy tests
+"""
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _warm_indicator_kernels():
+    """Run each indicator kernel once so JIT cost is paid per session, not per test"""
+    from src.agents.strategies.bollinger import calculate_bollinger_bands
+    from src.agents.strategies.meanreversion import calculate_rsi
+
+    prices = np.arange(100.0, 132.0)
+    calculate_rsi(prices, 14)
+    calculate_bollinger_bands(prices, 20, 2)
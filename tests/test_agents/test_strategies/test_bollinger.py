@@ -1,19 +1,16 @@
 """Tests for Bollinger Bands strategy"""
 import pytest
 import pandas as pd
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+import numpy as np
 from src.agents.strategies.bollinger import BollingerBandsStrategy
 from src.models.events import TradingSignalEvent
+from tests.helpers import EventBusStub
 
 
 @pytest.fixture
 def event_bus():
-    """Mock event bus"""
-    bus = MagicMock()
-    bus.subscribe = MagicMock(return_value=AsyncMock())
-    bus.publish = AsyncMock()
-    return bus
+    """Stub event bus"""
+    return EventBusStub()
 
 
 @pytest.fixture
@@ -59,12 +56,28 @@ def test_bollinger_calculate_bands():
             assert sma[i] > lower[i]
 
 
+@pytest.mark.parametrize('period', [1, 2, 20])
+def test_bollinger_bands_match_pandas(period):
+    """Test bands match pandas rolling mean and sample std"""
+    from src.agents.strategies.bollinger import calculate_bollinger_bands
+
+    prices = 50000 + np.cumsum(np.random.default_rng(7).normal(0, 25, 200))
+    sma, upper, lower = calculate_bollinger_bands(prices, period=period, num_std=2)
+
+    rolling = pd.Series(prices).rolling(window=period)
+    expected_sma = rolling.mean().to_numpy()
+    expected_std = rolling.std().to_numpy()
+
+    np.testing.assert_allclose(sma, expected_sma, rtol=1e-12)
+    np.testing.assert_allclose(upper, expected_sma + 2 * expected_std, rtol=1e-12)
+    np.testing.assert_allclose(lower, expected_sma - 2 * expected_std, rtol=1e-12)
+
+
 @pytest.mark.asyncio
 async def test_bollinger_no_signal_insufficient_data(bollinger_strategy):
     """Test no signal when insufficient data"""
     # Add only 10 prices (need 20)
-    for i in range(10):
-        bollinger_strategy.add_price(Decimal(str(100 + i)))
+    bollinger_strategy._ingest_prices_np(np.arange(100.0, 110.0))
 
     signal = await bollinger_strategy.analyze()
     assert signal is None
@@ -76,8 +89,7 @@ async def test_bollinger_buy_signal_at_lower_band(bollinger_strategy):
     # Add prices trending down then touching lower band
     prices = [110] * 10 + list(range(110, 90, -1))  # Declining prices
 
-    for price in prices:
-        bollinger_strategy.add_price(Decimal(str(price)))
+    bollinger_strategy._ingest_prices_np(np.array(prices, dtype=np.float64))
 
     signal = await bollinger_strategy.analyze()
 
@@ -94,8 +106,7 @@ async def test_bollinger_sell_signal_at_upper_band(bollinger_strategy):
     # Add prices trending up then touching upper band
     prices = [90] * 10 + list(range(90, 110))  # Rising prices
 
-    for price in prices:
-        bollinger_strategy.add_price(Decimal(str(price)))
+    bollinger_strategy._ingest_prices_np(np.array(prices, dtype=np.float64))
 
     signal = await bollinger_strategy.analyze()
 
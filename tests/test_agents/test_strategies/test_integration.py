@@ -1,7 +1,7 @@
 """Integration tests for new strategies"""
 import pytest
-from unittest.mock import MagicMock, AsyncMock
-from decimal import Decimal
+import numpy as np
+from tests.helpers import EventBusStub
 
 
 @pytest.mark.asyncio
@@ -9,15 +9,13 @@ async def test_bollinger_strategy_full_cycle():
     """Test Bollinger strategy through full signal cycle"""
     from src.agents.strategies.bollinger import BollingerBandsStrategy
 
-    event_bus = MagicMock()
-    event_bus.subscribe = MagicMock(return_value=AsyncMock())
-    event_bus.publish = AsyncMock()
+    event_bus = EventBusStub()
 
     strategy = BollingerBandsStrategy(event_bus, symbol='ETHUSDT')
 
     # Add enough data for analysis
     for i in range(30):
-        strategy.add_price(Decimal(str(100 + i * 0.5)))
+        strategy.add_price(100 + i * 0.5)
 
     # Should be able to analyze
     signal = await strategy.analyze()
@@ -30,21 +28,52 @@ async def test_meanreversion_strategy_full_cycle():
     """Test Mean Reversion strategy through full signal cycle"""
     from src.agents.strategies.meanreversion import MeanReversionStrategy
 
-    event_bus = MagicMock()
-    event_bus.subscribe = MagicMock(return_value=AsyncMock())
-    event_bus.publish = AsyncMock()
+    event_bus = EventBusStub()
 
     strategy = MeanReversionStrategy(event_bus, symbol='BTCUSDT')
 
     # Add enough data for analysis
     for i in range(30):
-        strategy.add_price(Decimal(str(100 + i * 0.5)))
+        strategy.add_price(100 + i * 0.5)
 
     # Should be able to analyze
     signal = await strategy.analyze()
     assert signal is None or signal.symbol == 'BTCUSDT'
 
 
+def test_bollinger_batch_matches_per_tick():
+    """Test Bollinger batch mode emits the same signals as per-tick analysis"""
+    from src.agents.strategies.bollinger import BollingerBandsStrategy
+
+    event_bus = EventBusStub()
+
+    # Flat, then a spike up and a crash down
+    prices = np.array([100.0] * 20 + [100.5, 99.5] * 5 + [110.0, 90.0])
+
+    signals = BollingerBandsStrategy(event_bus).analyze_batch(prices)
+
+    assert len(signals) == len(prices)
+    assert signals[-2] == -1  # sell at/above upper band
+    assert signals[-1] == 1  # buy at/below lower band
+    assert not signals[:19].any()  # nothing during warmup
+
+
+def test_meanreversion_batch_signals():
+    """Test Mean Reversion batch mode flags oversold then overbought"""
+    from src.agents.strategies.meanreversion import MeanReversionStrategy
+
+    event_bus = EventBusStub()
+
+    prices = np.array([100.0, 101.0] * 10 + list(range(100, 70, -2)) + list(range(70, 130, 3)),
+                      dtype=np.float64)
+
+    signals = MeanReversionStrategy(event_bus).analyze_batch(prices)
+    emitted = signals[signals != 0].tolist()
+
+    # Repeated sides are collapsed like the live path
+    assert emitted == [1, -1]
+
+
 def test_strategies_can_be_imported():
     """Test that all strategies can be imported"""
     from src.agents.strategies import (
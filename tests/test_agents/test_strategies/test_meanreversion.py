@@ -2,19 +2,15 @@
 import pytest
 import pandas as pd
 import numpy as np
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 from src.agents.strategies.meanreversion import MeanReversionStrategy
 from src.models.events import TradingSignalEvent
+from tests.helpers import EventBusStub
 
 
 @pytest.fixture
 def event_bus():
-    """Mock event bus"""
-    bus = MagicMock()
-    bus.subscribe = MagicMock(return_value=AsyncMock())
-    bus.publish = AsyncMock()
-    return bus
+    """Stub event bus"""
+    return EventBusStub()
 
 
 @pytest.fixture
@@ -64,8 +60,7 @@ def test_rsi_calculation():
 async def test_meanreversion_no_signal_insufficient_data(meanreversion_strategy):
     """Test no signal when insufficient data"""
     # Add only 10 prices (need 14+ for RSI)
-    for i in range(10):
-        meanreversion_strategy.add_price(Decimal(str(100 + i)))
+    meanreversion_strategy._ingest_prices_np(np.arange(100.0, 110.0))
 
     signal = await meanreversion_strategy.analyze()
     assert signal is None
@@ -77,8 +72,7 @@ async def test_meanreversion_buy_signal_oversold(meanreversion_strategy):
     # Create oversold condition: sharp decline
     prices = [100] * 5 + list(range(100, 70, -2))  # Sharp decline
 
-    for price in prices:
-        meanreversion_strategy.add_price(Decimal(str(price)))
+    meanreversion_strategy._ingest_prices_np(np.array(prices, dtype=np.float64))
 
     signal = await meanreversion_strategy.analyze()
 
@@ -96,8 +90,7 @@ async def test_meanreversion_sell_signal_overbought(meanreversion_strategy):
     # Create overbought condition: sharp rise
     prices = [70] * 5 + list(range(70, 100, 2))  # Sharp rise
 
-    for price in prices:
-        meanreversion_strategy.add_price(Decimal(str(price)))
+    meanreversion_strategy._ingest_prices_np(np.array(prices, dtype=np.float64))
 
     signal = await meanreversion_strategy.analyze()
 
@@ -5,10 +5,15 @@ import pytest
 import asyncio
 from datetime import datetime
 from decimal import Decimal
+import numpy as np
 from src.agents.strategies.momentum import MomentumStrategy
 from src.agents.strategies.macd import MACDStrategy
 from src.core.event_bus import EventBus
 from src.models.events import MarketTickEvent, TradingSignalEvent
+from tests.helpers import drain, drain_one
+
+# Shared by every tick; Decimals are immutable
+TICK_VOLUME = Decimal('1000')
 
 
 @pytest.fixture
@@ -58,20 +63,20 @@ async def test_strategy_accumulates_price_history(event_bus, momentum_strategy):
     signal_queue = event_bus.subscribe(TradingSignalEvent)
 
     # Start strategy in background
-    strategy_task = asyncio.create_task(momentum_strategy.start())
+    strategy_task = asyncio.create_task(momentum_strategy.run())
 
     # Publish some price ticks
     for i in range(10):
         tick = MarketTickEvent(
             symbol='BTCUSDT',
-            price=Decimal(f'{50000 + i * 100}'),
-            volume=Decimal('1000')
+            price=50000.0 + i * 100,
+            volume=TICK_VOLUME
         )
         await event_bus.publish(tick)
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
 
-    # Give strategy time to process
-    await asyncio.sleep(0.1)
+    # Let the strategy consume everything published
+    await drain(event_bus, MarketTickEvent)
 
     # Check price history accumulated
     assert len(momentum_strategy.price_history) == 10
@@ -88,7 +93,7 @@ async def test_strategy_accumulates_price_history(event_bus, momentum_strategy):
 async def test_momentum_strategy_generates_buy_signal(event_bus, momentum_strategy):
     """Test that momentum strategy generates buy signal on bullish crossover"""
     signal_queue = event_bus.subscribe(TradingSignalEvent)
-    strategy_task = asyncio.create_task(momentum_strategy.start())
+    strategy_task = asyncio.create_task(momentum_strategy.run())
 
     try:
         # Simulate downtrend then uptrend (should trigger buy signal)
@@ -104,14 +109,14 @@ async def test_momentum_strategy_generates_buy_signal(event_bus, momentum_strate
 
             tick = MarketTickEvent(
                 symbol='BTCUSDT',
-                price=Decimal(str(price)),
-                volume=Decimal('1000')
+                price=float(price),
+                volume=TICK_VOLUME
             )
             await event_bus.publish(tick)
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
         # Wait for signal
-        signal = await asyncio.wait_for(signal_queue.get(), timeout=2.0)
+        signal = await drain_one(signal_queue, timeout=2.0)
 
         assert isinstance(signal, TradingSignalEvent)
         assert signal.strategy_name == 'momentum'
@@ -131,7 +136,7 @@ async def test_momentum_strategy_generates_buy_signal(event_bus, momentum_strate
 async def test_momentum_strategy_generates_sell_signal(event_bus, momentum_strategy):
     """Test that momentum strategy generates sell signal on bearish crossover"""
     signal_queue = event_bus.subscribe(TradingSignalEvent)
-    strategy_task = asyncio.create_task(momentum_strategy.start())
+    strategy_task = asyncio.create_task(momentum_strategy.run())
 
     try:
         # Simulate uptrend then downtrend (should trigger sell signal)
@@ -146,14 +151,14 @@ async def test_momentum_strategy_generates_sell_signal(event_bus, momentum_strat
 
             tick = MarketTickEvent(
                 symbol='BTCUSDT',
-                price=Decimal(str(price)),
-                volume=Decimal('1000')
+                price=float(price),
+                volume=TICK_VOLUME
             )
             await event_bus.publish(tick)
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
         # Wait for signal
-        signal = await asyncio.wait_for(signal_queue.get(), timeout=2.0)
+        signal = await drain_one(signal_queue, timeout=2.0)
 
         assert isinstance(signal, TradingSignalEvent)
         assert signal.side == 'sell'
@@ -170,20 +175,20 @@ async def test_momentum_strategy_generates_sell_signal(event_bus, momentum_strat
 async def test_strategy_ignores_other_symbols(event_bus, momentum_strategy):
     """Test that strategy ignores ticks for other symbols"""
     signal_queue = event_bus.subscribe(TradingSignalEvent)
-    strategy_task = asyncio.create_task(momentum_strategy.start())
+    strategy_task = asyncio.create_task(momentum_strategy.run())
 
     try:
         # Send ticks for different symbol
         for i in range(60):
             tick = MarketTickEvent(
                 symbol='ETHUSDT',  # Different symbol
-                price=Decimal(f'{3000 + i * 10}'),
-                volume=Decimal('1000')
+                price=3000.0 + i * 10,
+                volume=TICK_VOLUME
             )
             await event_bus.publish(tick)
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
-        await asyncio.sleep(0.1)
+        await drain(event_bus, MarketTickEvent)
 
         # Should not accumulate history
         assert len(momentum_strategy.price_history) == 0
@@ -199,7 +204,7 @@ async def test_strategy_ignores_other_symbols(event_bus, momentum_strategy):
 @pytest.mark.asyncio
 async def test_strategy_limits_history_size(event_bus, momentum_strategy):
     """Test that strategy limits price history size"""
-    strategy_task = asyncio.create_task(momentum_strategy.start())
+    strategy_task = asyncio.create_task(momentum_strategy.run())
 
     try:
         # Send more ticks than max_history
@@ -207,13 +212,13 @@ async def test_strategy_limits_history_size(event_bus, momentum_strategy):
         for i in range(max_history + 50):
             tick = MarketTickEvent(
                 symbol='BTCUSDT',
-                price=Decimal(f'{50000 + i}'),
-                volume=Decimal('1000')
+                price=50000.0 + i,
+                volume=TICK_VOLUME
             )
             await event_bus.publish(tick)
-            await asyncio.sleep(0.001)
+            await asyncio.sleep(0)
 
-        await asyncio.sleep(0.2)
+        await drain(event_bus, MarketTickEvent)
 
         # History should be limited to max_history
         assert len(momentum_strategy.price_history) <= max_history
@@ -230,7 +235,7 @@ async def test_strategy_limits_history_size(event_bus, momentum_strategy):
 async def test_macd_strategy_generates_signal(event_bus, macd_strategy):
     """Test that MACD strategy can generate signals"""
     signal_queue = event_bus.subscribe(TradingSignalEvent)
-    strategy_task = asyncio.create_task(macd_strategy.start())
+    strategy_task = asyncio.create_task(macd_strategy.run())
 
     try:
         # Simulate price movement that should trigger MACD signal
@@ -243,14 +248,14 @@ async def test_macd_strategy_generates_signal(event_bus, macd_strategy):
 
             tick = MarketTickEvent(
                 symbol='BTCUSDT',
-                price=Decimal(str(price)),
-                volume=Decimal('1000')
+                price=float(price),
+                volume=TICK_VOLUME
             )
             await event_bus.publish(tick)
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
         # Should eventually get a signal
-        signal = await asyncio.wait_for(signal_queue.get(), timeout=3.0)
+        signal = await drain_one(signal_queue, timeout=3.0)
 
         assert isinstance(signal, TradingSignalEvent)
         assert signal.strategy_name == 'macd'
@@ -262,3 +267,75 @@ async def test_macd_strategy_generates_signal(event_bus, macd_strategy):
             await strategy_task
         except asyncio.CancelledError:
             pass
+
+
+def test_price_history_view_wraps_at_max_history(event_bus):
+    """Test that price history keeps the newest ticks in order"""
+    strategy = MomentumStrategy(event_bus, 'BTCUSDT')
+    max_history = strategy.max_history
+
+    for i in range(max_history + 5):
+        strategy.price_history.append({
+            'time': datetime(2024, 1, 1),
+            'price': 100 + i,
+            'volume': 1.0
+        })
+
+    history = strategy.price_history
+    assert len(history) == max_history
+    assert history[0]['price'] == 105.0
+    assert history[-1]['price'] == 100.0 + max_history + 4
+    assert strategy.prices_view().tolist() == [e['price'] for e in history]
+    assert history[-1] == list(history)[-1]
+    assert [e['price'] for e in history[-3:]] == [
+        100.0 + max_history + 2, 100.0 + max_history + 3, 100.0 + max_history + 4
+    ]
+    assert history[::-1][0] == history[-1]
+    with pytest.raises(IndexError):
+        history[max_history]
+
+
+def test_indicators_cached_until_new_price(event_bus):
+    """Test that indicator values are reused until the buffer changes"""
+    strategy = MomentumStrategy(event_bus, 'BTCUSDT')
+    strategy._ingest_prices_np(np.arange(100.0, 160.0))
+
+    first = strategy.sma_short()
+    assert strategy.sma_short() is first
+
+    strategy.add_price(1000.0)
+    assert strategy.sma_short() is not first
+    assert strategy.sma_short()[0] > first[0]
+
+
+@pytest.mark.asyncio
+async def test_strategy_start_requires_run(momentum_strategy):
+    """Test start() refuses to run outside run()'s lifecycle"""
+    with pytest.raises(RuntimeError, match='run()'):
+        await momentum_strategy.start()
+
+
+async def _live_side_codes(strategy, prices) -> list[int]:
+    """Feed prices one at a time through analyze() and record the side codes"""
+    codes = []
+    for price in prices:
+        strategy.add_price(price)
+        signal = None
+        if strategy._count >= strategy.params['warmup_period']:
+            signal = await strategy.analyze()
+        codes.append(0 if signal is None else {'buy': 1, 'sell': -1}[signal.side])
+    return codes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('strategy_class', [MomentumStrategy, MACDStrategy])
+async def test_batch_mode_matches_per_tick(event_bus, strategy_class):
+    """Test analyze_batch() emits the same signals as per-tick analyze()"""
+    # A few slow swings, so both strategies cross several times
+    prices = 50000 + 500 * np.sin(np.arange(400) / 15.0)
+
+    signals = strategy_class(event_bus, 'BTCUSDT').analyze_batch(prices)
+    live = await _live_side_codes(strategy_class(event_bus, 'BTCUSDT'), prices.tolist())
+
+    assert signals.tolist() == live
+    assert (signals == 1).any() and (signals == -1).any()
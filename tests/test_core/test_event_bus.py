@@ -5,13 +5,20 @@ import pytest
 import asyncio
 from decimal import Decimal
 
-from src.core.event_bus import EventBus, consume_events, consume_events_with_timeout
+from src.core.event_bus import (
+    EventBus,
+    FastQueue,
+    consume_events,
+    consume_event_batches,
+    consume_events_with_timeout
+)
 from src.models.events import (
     Event,
     MarketTickEvent,
     TradingSignalEvent,
     TradeExecutedEvent
 )
+from tests.helpers import drain, drain_one
 
 
 @pytest.mark.asyncio
@@ -55,9 +62,10 @@ class TestEventBus:
         await bus.publish(event)
 
         # Receive event
-        received = await asyncio.wait_for(queue.get(), timeout=1.0)
+        received = await drain_one(queue)
 
         assert received == event
+        assert received is event
         assert received.symbol == 'BTCUSDT'
         assert received.price == Decimal('50000.00')
 
@@ -76,11 +84,14 @@ class TestEventBus:
         await bus.publish(event)
 
         # Both queues should receive the event
-        received1 = await asyncio.wait_for(queue1.get(), timeout=1.0)
-        received2 = await asyncio.wait_for(queue2.get(), timeout=1.0)
+        received1 = await drain_one(queue1)
+        received2 = await drain_one(queue2)
 
         assert received1 == event
         assert received2 == event
+        # Fan-out shares the frozen event, never a copy
+        assert received1 is event
+        assert received2 is event
 
     async def test_type_filtering(self):
         """Test that subscribers only receive subscribed event types"""
@@ -107,8 +118,8 @@ class TestEventBus:
         await bus.publish(signal_event)
 
         # Each queue should only receive its subscribed type
-        received_tick = await asyncio.wait_for(tick_queue.get(), timeout=1.0)
-        received_signal = await asyncio.wait_for(signal_queue.get(), timeout=1.0)
+        received_tick = await drain_one(tick_queue)
+        received_signal = await drain_one(signal_queue)
 
         assert isinstance(received_tick, MarketTickEvent)
         assert isinstance(received_signal, TradingSignalEvent)
@@ -128,6 +139,18 @@ class TestEventBus:
 
         assert bus.get_subscriber_count(MarketTickEvent) == 0
 
+    async def test_subscriber_snapshot_is_copy_on_write(self):
+        """Test (un)subscribe replaces the subscriber tuple instead of mutating it"""
+        bus = EventBus()
+        first = bus.subscribe(MarketTickEvent)
+        snapshot = bus._subs[MarketTickEvent]
+
+        second = bus.subscribe(MarketTickEvent)
+        bus.unsubscribe(MarketTickEvent, first)
+
+        assert snapshot == (first,)
+        assert bus._subs[MarketTickEvent] == (second,)
+
     async def test_publish_with_no_subscribers(self):
         """Test publishing when no subscribers exist"""
         bus = EventBus()
@@ -159,25 +182,47 @@ class TestEventBus:
 
         # Queue should have max 2 items (3rd dropped)
         assert queue.qsize() <= 2
+        assert queue.dropped == 1
+        assert bus.dropped_count == 1
+        assert bus.get_stats()['total_dropped'] == 1
 
     async def test_publish_multiple(self):
         """Test publishing multiple events at once"""
         bus = EventBus()
         queue = bus.subscribe(MarketTickEvent)
 
-        events = [
-            MarketTickEvent(
-                symbol='BTCUSDT',
-                price=Decimal(f'{50000 + i}.00'),
-                volume=Decimal('1.0')
-            )
+        events = MarketTickEvent.make_batch(
+            {
+                'symbol': 'BTCUSDT',
+                'price': Decimal(f'{50000 + i}.00'),
+                'volume': Decimal('1.0')
+            }
             for i in range(5)
-        ]
+        )
 
         await bus.publish_multiple(events)
 
         # Should receive all events
         assert queue.qsize() == 5
+        assert events[0].timestamp == events[-1].timestamp
+
+    async def test_publish_multiple_mixed_types(self):
+        """Test publish_multiple routes mixed event types in order"""
+        bus = EventBus()
+        tick_queue = bus.subscribe(MarketTickEvent)
+        signal_queue = bus.subscribe(TradingSignalEvent)
+
+        ticks = [
+            MarketTickEvent(symbol='BTCUSDT', price=Decimal(50000 + i))
+            for i in range(3)
+        ]
+        signal = TradingSignalEvent(strategy_name='momentum', side='buy')
+
+        await bus.publish_multiple([ticks[0], signal, ticks[1], ticks[2]])
+
+        assert [tick_queue.get_nowait() for _ in range(3)] == ticks
+        assert signal_queue.get_nowait() == signal
+        assert bus.published_count == 4
 
     async def test_get_stats(self):
         """Test getting event bus statistics"""
@@ -201,6 +246,55 @@ class TestEventBus:
         assert 'MarketTickEvent' in stats['event_types']
         assert stats['subscribers_by_type']['MarketTickEvent'] == 2
 
+    async def test_get_stats_tracks_unsubscribe(self):
+        """Test subscriber counters follow unsubscribe and close"""
+        bus = EventBus()
+        queue = bus.subscribe(MarketTickEvent)
+        bus.subscribe(MarketTickEvent)
+
+        bus.unsubscribe(MarketTickEvent, queue)
+        bus.unsubscribe(MarketTickEvent, queue)  # Already removed
+
+        stats = bus.get_stats()
+        assert stats['total_subscribers'] == 1
+        assert stats['subscribers_by_type'] == {'MarketTickEvent': 1}
+
+        await bus.close()
+        assert bus.get_stats()['total_subscribers'] == 0
+
+    async def test_drain(self):
+        """Test drain waits for consumers to empty their queues"""
+        bus = EventBus()
+        queue = bus.subscribe(MarketTickEvent)
+        received = []
+
+        async def consume():
+            while True:
+                received.append(await queue.get())
+
+        consumer = asyncio.create_task(consume())
+        for i in range(3):
+            await bus.publish(MarketTickEvent(
+                symbol='BTCUSDT',
+                price=Decimal(f'{50000 + i}.00'),
+                volume=Decimal('1.0')
+            ))
+
+        await drain(bus, MarketTickEvent)
+        consumer.cancel()
+
+        assert len(received) == 3
+        assert queue.empty()
+
+    async def test_drain_times_out_without_consumer(self):
+        """Test drain gives up when nobody reads the queue"""
+        bus = EventBus()
+        bus.subscribe(MarketTickEvent)
+        await bus.publish(MarketTickEvent(symbol='BTCUSDT'))
+
+        with pytest.raises(TimeoutError):
+            await drain(bus, MarketTickEvent, timeout=0.05)
+
     async def test_close(self):
         """Test closing event bus"""
         bus = EventBus()
@@ -218,6 +312,62 @@ class TestEventBus:
         assert bus.get_total_subscribers() == 0
 
 
+@pytest.mark.asyncio
+class TestFastQueue:
+    """Test the subscriber queue"""
+
+    async def test_fifo_and_sizes(self):
+        """Test items come out in order and sizes are tracked"""
+        queue = FastQueue(maxsize=2)
+        assert queue.empty()
+
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        assert queue.full()
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(3)
+
+        assert await queue.get() == 1
+        assert queue.get_nowait() == 2
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    async def test_get_waits_for_put(self):
+        """Test a waiting getter is woken by put_nowait"""
+        queue = FastQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        queue.put_nowait('x')
+
+        assert await getter == 'x'
+
+    async def test_cancelled_getter_does_not_lose_items(self):
+        """Test cancelling a waiting getter leaves later items for others"""
+        queue = FastQueue()
+        cancelled = asyncio.create_task(queue.get())
+        waiting = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        queue.put_nowait('x')
+
+        assert await waiting == 'x'
+        assert cancelled.cancelled()
+
+    async def test_put_many_wakes_once_and_respects_maxsize(self):
+        """Test a batch put wakes a single waiter and drops the overflow"""
+        queue = FastQueue(maxsize=3)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        assert queue.put_many([1, 2, 3, 4]) == 3
+        assert queue.dropped == 1
+        assert await getter == 1
+        assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+        assert queue.put_many([]) == 0
+
+
 @pytest.mark.asyncio
 class TestEventConsumption:
     """Test event consumption utilities"""
@@ -252,6 +402,31 @@ class TestEventConsumption:
         assert len(consumed) == 3
         assert all(isinstance(e, MarketTickEvent) for e in consumed)
 
+    async def test_consume_event_batches(self):
+        """Test that queued events are drained as one batch"""
+        bus = EventBus()
+        queue = bus.subscribe(MarketTickEvent)
+
+        for i in range(5):
+            await bus.publish(MarketTickEvent(
+                symbol='BTCUSDT',
+                price=Decimal(f'{50000 + i}.00'),
+                volume=Decimal('1.0')
+            ))
+
+        consumer = consume_event_batches(queue, max_batch=3)
+
+        # Batches are capped at max_batch and keep arrival order
+        first = await asyncio.wait_for(consumer.__anext__(), timeout=1.0)
+        second = await asyncio.wait_for(consumer.__anext__(), timeout=1.0)
+
+        assert [e.price for e in first + second] == [
+            Decimal(f'{50000 + i}.00') for i in range(5)
+        ]
+        assert len(first) == 3
+        assert len(second) == 2
+        assert queue.empty()
+
     async def test_consume_events_with_timeout(self):
         """Test consuming events with timeout"""
         bus = EventBus()
@@ -275,6 +450,18 @@ class TestEventConsumption:
         received = await consumer.__anext__()
         assert received is None
 
+    async def test_consumer_stops_when_cancelled(self):
+        """Test a cancelled consumer ends iteration and stays finished"""
+        queue = EventBus().subscribe(MarketTickEvent)
+        consumer = consume_events(queue)
+
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(consumer.__anext__(), timeout=0.01)
+
+        queue.put_nowait(MarketTickEvent(symbol='BTCUSDT'))
+        with pytest.raises(StopAsyncIteration):
+            await consumer.__anext__()
+
 
 @pytest.mark.asyncio
 class TestConcurrentOperations:
@@ -304,13 +491,30 @@ class TestConcurrentOperations:
         # Should have received all 30 events
         assert queue.qsize() == 30
 
+    async def test_publish_nowait_from_sync_code(self):
+        """Test publish_nowait delivers without awaiting"""
+        bus = EventBus()
+        queue = bus.subscribe(MarketTickEvent)
+
+        def publish_events(count: int):
+            for i in range(count):
+                bus.publish_nowait(MarketTickEvent(
+                    symbol='BTCUSDT',
+                    price=Decimal(f'{50000 + i}.00')
+                ))
+
+        publish_events(30)
+
+        assert queue.qsize() == 30
+        assert bus.published_count == 30
+
     async def test_concurrent_subscribe_and_publish(self):
         """Test subscribing and publishing concurrently"""
         bus = EventBus()
 
         async def subscribe_and_consume():
             queue = bus.subscribe(MarketTickEvent)
-            event = await asyncio.wait_for(queue.get(), timeout=2.0)
+            event = await drain_one(queue, timeout=2.0)
             return event
 
         async def publish_events():
@@ -0,0 +1,44 @@
+"""
+Tests for the IcarusSystem orchestrator
+"""
+import asyncio
+from decimal import Decimal
+from src.agents.strategies.momentum import MomentumStrategy
+from src.core.event_bus import EventBus
+from src.main import IcarusSystem
+from src.models.events import AgentStartedEvent, AgentStoppedEvent, MarketTickEvent
+from tests.helpers import drain, drain_one
+
+
+async def test_start_runs_agents_with_lifecycle():
+    """Test start() launches agents through run() so they keep consuming"""
+    event_bus = EventBus()
+    started_queue = event_bus.subscribe(AgentStartedEvent)
+    stopped_queue = event_bus.subscribe(AgentStoppedEvent)
+    strategy = MomentumStrategy(event_bus, 'BTCUSDT')
+
+    system = IcarusSystem()
+    system.event_bus = event_bus
+    system.agents = [strategy]
+    system_task = asyncio.create_task(system.start())
+
+    started = await drain_one(started_queue)
+    assert started.agent_name == strategy.name
+    assert strategy.is_running
+
+    # Separate batches: an agent started without run() stops after the first
+    for i in range(3):
+        await event_bus.publish(MarketTickEvent(
+            symbol='BTCUSDT',
+            price=50000.0 + i,
+            volume=Decimal('1')
+        ))
+        await drain(event_bus, MarketTickEvent)
+    assert len(strategy.price_history) == 3
+
+    system.request_shutdown()
+    await asyncio.wait_for(system_task, timeout=1.0)
+
+    stopped = await drain_one(stopped_queue)
+    assert stopped.agent_name == strategy.name
+    assert not strategy.is_running
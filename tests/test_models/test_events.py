@@ -1,11 +1,14 @@
 """
 Tests for event models
 """
+import numpy as np
 import pytest
+from dataclasses import FrozenInstanceError, dataclass
 from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
 
+from src.models import events
 from src.models.events import (
     Event,
     MarketTickEvent,
@@ -17,10 +20,52 @@ from src.models.events import (
     RiskAlertEvent,
     AgentStartedEvent,
     get_event_type,
-    EVENT_TYPES
+    event_type_id,
+    get_event_class,
+    EVENT_TYPES,
+    _register_event_types
 )
 
 
+# Wire ids of every event type in this module. Pinned so that reordering
+# the registry fails here instead of breaking decoding across processes;
+# new event types are appended with the next id.
+WIRE_IDS = {
+    'MarketTickEvent': 0,
+    'OHLCVEvent': 1,
+    'MarketDataErrorEvent': 2,
+    'TradingSignalEvent': 3,
+    'SignalCancelledEvent': 4,
+    'OrderPlacedEvent': 5,
+    'TradeExecutedEvent': 6,
+    'OrderCancelledEvent': 7,
+    'TradeErrorEvent': 8,
+    'PositionOpenedEvent': 9,
+    'PositionUpdatedEvent': 10,
+    'PositionClosedEvent': 11,
+    'PortfolioSnapshotEvent': 12,
+    'AllocationEvent': 13,
+    'RebalanceRequestEvent': 14,
+    'RebalanceCompletedEvent': 15,
+    'ForkRequestEvent': 16,
+    'ForkCreatedEvent': 17,
+    'ForkCompletedEvent': 18,
+    'ForkDestroyedEvent': 19,
+    'RiskAlertEvent': 20,
+    'EmergencyHaltEvent': 21,
+    'HaltResumedEvent': 22,
+    'AgentStartedEvent': 23,
+    'AgentStoppedEvent': 24,
+    'AgentErrorEvent': 25,
+    'AgentHeartbeatEvent': 26,
+    'BacktestStartedEvent': 27,
+    'BacktestCompletedEvent': 28,
+}
+
+# The module's event classes, independent of whatever else subclasses Event
+EVENT_CLASSES = tuple(getattr(events, name) for name in WIRE_IDS)
+
+
 class TestBaseEvent:
     """Test base Event class"""
 
@@ -30,12 +75,55 @@ class TestBaseEvent:
         assert isinstance(event.event_id, UUID)
         assert isinstance(event.timestamp, datetime)
 
+    def test_event_ids_are_unique_uuid4(self):
+        """Test pooled event ids are distinct version-4 UUIDs"""
+        ids = {Event().event_id for _ in range(3000)}
+        ids.add(Event.new_id())
+
+        assert len(ids) == 3001
+        assert all(event_id.version == 4 for event_id in ids)
+
+    def test_make_batch_shares_timestamp(self):
+        """Test make_batch builds events stamped with a single clock read"""
+        events = MarketTickEvent.make_batch(
+            {'symbol': 'BTCUSDT', 'price': Decimal(50000 + i)} for i in range(5)
+        )
+
+        assert [e.price for e in events] == [Decimal(50000 + i) for i in range(5)]
+        assert all(isinstance(e, MarketTickEvent) for e in events)
+        assert events[0].timestamp == events[-1].timestamp
+        assert len({e.event_id for e in events}) == 5
+
     def test_event_is_immutable(self):
         """Test that events are frozen (immutable)"""
         event = Event()
         with pytest.raises(Exception):  # FrozenInstanceError
             event.event_id = None
 
+    def test_events_are_slotted(self):
+        """Test that every event class is slotted and still frozen"""
+        for event_class in (Event, *EVENT_CLASSES):
+            assert not hasattr(event_class(), '__dict__')
+
+        tick = MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.00'))
+        with pytest.raises(FrozenInstanceError):
+            tick.price = Decimal('1')
+
+    def test_event_equality_and_hash(self):
+        """Test events compare by field values and hash consistently"""
+        event = MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.00'))
+        same = MarketTickEvent(
+            event_id=event.event_id,
+            timestamp=event.timestamp,
+            symbol='BTCUSDT',
+            price=Decimal('50000.00')
+        )
+
+        assert event == event
+        assert event == same and hash(event) == hash(same)
+        assert event != MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.00'))
+        assert Event(event_id=event.event_id, timestamp=event.timestamp) != event
+
     def test_event_to_dict(self):
         """Test event serialization"""
         event = Event()
@@ -77,6 +165,69 @@ class TestMarketDataEvents:
         assert data['symbol'] == 'BTCUSDT'
         assert data['price'] == 50000.00
         assert data['volume'] == 1.5
+        assert 'price_f' not in data
+
+    def test_market_tick_to_dict_optional_fields(self):
+        """Test Optional fields serialize as None or their converted value"""
+        event = MarketTickEvent(symbol='BTCUSDT', bid=Decimal('49999.50'))
+        data = event.to_dict()
+
+        assert data['bid'] == 49999.5
+        assert isinstance(data['bid'], float)
+        assert data['ask'] is None
+        assert data['timestamp'] == str(event.timestamp)
+        assert data['event_id'] == str(event.event_id)
+
+    def test_to_dict_follows_runtime_types(self):
+        """Test values that don't match their annotation serialize by runtime type"""
+        signal = TradingSignalEvent(strategy_name='momentum', confidence=None)
+        assert signal.to_dict()['confidence'] is None
+
+        # A Decimal stored in a str field still becomes a float
+        assert TradingSignalEvent(symbol=Decimal('1.5')).to_dict()['symbol'] == 1.5
+
+    def test_market_tick_accepts_float_price(self):
+        """Test MarketTickEvent normalizes a float price to Decimal"""
+        event = MarketTickEvent(symbol='BTCUSDT', price=50000.1)
+
+        assert event.price == Decimal('50000.1')
+        assert event.price_f == 50000.1
+
+    def test_market_tick_accepts_numpy_scalar_price(self):
+        """Test MarketTickEvent normalizes numpy scalars (and None) like builtins"""
+        event = MarketTickEvent(symbol='BTCUSDT', price=np.float64(50000.1))
+        assert event.price == Decimal('50000.1')
+        assert event.price_f == 50000.1
+
+        assert MarketTickEvent(price=np.int64(3)).price == Decimal('3')
+        unpriced = MarketTickEvent(price=None)
+        assert unpriced.price is None
+        assert unpriced.price_f is None
+
+    def test_market_tick_float_price(self):
+        """Test MarketTickEvent carries a float copy of its price"""
+        event = MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.25'))
+
+        assert event.price_f == 50000.25
+        assert isinstance(event.price_f, float)
+        assert event == MarketTickEvent(
+            event_id=event.event_id,
+            timestamp=event.timestamp,
+            symbol='BTCUSDT',
+            price=Decimal('50000.25')
+        )
+
+    def test_market_tick_fixed_point_price(self):
+        """Test MarketTickEvent carries an integer 1e-8 price"""
+        event = MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.12345678'))
+        assert event.price_e8 == 5_000_012_345_678
+        assert MarketTickEvent(price=0.1).price_e8 == 10_000_000
+        assert MarketTickEvent(price=None).price_e8 is None
+        assert 'price_e8' not in event.to_dict()
+
+        rebuilt = MarketTickEvent.from_price_e8(event.price_e8, symbol='BTCUSDT')
+        assert rebuilt.price == Decimal('50000.12345678')
+        assert rebuilt.price_e8 == event.price_e8
 
 
 class TestTradingSignalEvents:
@@ -259,6 +410,48 @@ class TestEventTypeRegistry:
             assert callable(event_class)
             assert event_name == event_class.__name__
 
+    def test_registry_holds_final_slotted_classes(self):
+        """Test registration keeps the slots-rebuilt class and its cached name"""
+        assert EVENT_TYPES['MarketTickEvent'] is MarketTickEvent
+        assert MarketTickEvent._event_name == 'MarketTickEvent'
+        assert TradingSignalEvent._event_name == 'TradingSignalEvent'
+
+    def test_event_type_ids_round_trip(self):
+        """Test integer type ids resolve back to their classes"""
+        for event_class in EVENT_CLASSES:
+            type_id = event_type_id(event_class())
+            assert get_event_class(type_id) is event_class
+
+        with pytest.raises(IndexError):
+            get_event_class(-1)
+
+    def test_event_type_ids_are_pinned(self):
+        """Test wire ids match the pinned table and the registry holds nothing else"""
+        assert {name: cls._type_id for name, cls in EVENT_TYPES.items()} == WIRE_IDS
+
+    def test_subclasses_outside_the_module_are_not_registered(self):
+        """Test event subclasses defined elsewhere get no registry entry or id"""
+        count = len(EVENT_TYPES)
+
+        @dataclass(frozen=True, slots=True, eq=False)
+        class MarketTickEvent(Event):  # same name as the real event type
+            pass
+
+        assert len(EVENT_TYPES) == count
+        assert EVENT_TYPES['MarketTickEvent'] is not MarketTickEvent
+        assert event_type_id(MarketTickEvent()) == -1
+        assert get_event_type(MarketTickEvent()) == 'MarketTickEvent'
+
+    def test_duplicate_event_type_name_raises(self):
+        """Test registering a second class under an existing name fails"""
+        with pytest.raises(ValueError):
+            _register_event_types((EVENT_TYPES['MarketTickEvent'],))
+
+    def test_event_type_registry_is_read_only(self):
+        """Test EVENT_TYPES cannot be modified by callers"""
+        with pytest.raises(TypeError):
+            EVENT_TYPES['Bogus'] = Event
+
 
 class TestEventDefaults:
     """Test event default values"""
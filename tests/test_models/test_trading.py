@@ -104,6 +104,20 @@ class TestPosition:
         assert data['symbol'] == 'BTCUSDT'
         assert data['quantity'] == 0.5
 
+    def test_position_is_slotted(self):
+        """Test positions carry no per-instance __dict__"""
+        pos = Position(
+            position_id=uuid4(),
+            strategy_name='momentum',
+            symbol='BTCUSDT',
+            quantity=Decimal('0.5'),
+            entry_price=Decimal('50000.00')
+        )
+
+        assert not hasattr(pos, '__dict__')
+        with pytest.raises(AttributeError):
+            pos.stop_loss = Decimal('45000.00')
+
 
 class TestClosedPosition:
     """Test ClosedPosition model"""
@@ -184,6 +198,19 @@ class TestPortfolio:
         assert portfolio.cash == Decimal('10000.00')
         assert portfolio.num_positions == 0
 
+    def test_empty_portfolio_aggregates_are_decimal(self):
+        """Test aggregates over no positions are Decimal zeros"""
+        portfolio = Portfolio(
+            strategy_name='momentum',
+            initial_capital=Decimal('10000.00'),
+            cash=Decimal('10000.00')
+        )
+
+        for value in (portfolio.positions_value, portfolio.unrealized_pnl,
+                      portfolio.realized_pnl, portfolio.exposure_pct):
+            assert isinstance(value, Decimal)
+            assert value == 0
+
     def test_portfolio_add_position(self):
         """Test adding position to portfolio"""
         portfolio = Portfolio(
@@ -337,6 +364,55 @@ class TestPortfolio:
 
         assert portfolio.get_position('BTCUSDT').current_price == Decimal('55000.00')
         assert portfolio.get_position('ETHUSDT').current_price == Decimal('2200.00')
+        # One batch, one timestamp
+        assert btc_pos.updated_at == eth_pos.updated_at
+
+    def test_portfolio_update_prices_subset(self):
+        """Test a tick batch smaller than the book only touches its symbols"""
+        portfolio = Portfolio(
+            strategy_name='momentum',
+            initial_capital=Decimal('10000.00'),
+            cash=Decimal('3000.00')
+        )
+        for symbol in ('BTCUSDT', 'ETHUSDT', 'SOLUSDT'):
+            portfolio.add_position(Position(
+                position_id=uuid4(),
+                strategy_name='momentum',
+                symbol=symbol,
+                quantity=Decimal('1.0'),
+                entry_price=Decimal('100.00')
+            ))
+
+        portfolio.update_prices({'ETHUSDT': Decimal('110.00'), 'XRPUSDT': Decimal('1.00')})
+
+        assert portfolio.get_position('ETHUSDT').unrealized_pnl == Decimal('10.00')
+        assert portfolio.get_position('BTCUSDT').current_price is None
+        assert portfolio.get_position('XRPUSDT') is None
+
+    def test_portfolio_to_dict_aggregates(self):
+        """Test serialized aggregates match the properties"""
+        portfolio = Portfolio(
+            strategy_name='momentum',
+            initial_capital=Decimal('10000.00'),
+            cash=Decimal('5000.00')
+        )
+        pos = Position(
+            position_id=uuid4(),
+            strategy_name='momentum',
+            symbol='BTCUSDT',
+            quantity=Decimal('0.1'),
+            entry_price=Decimal('50000.00')
+        )
+        portfolio.add_position(pos)
+        portfolio.update_prices({'BTCUSDT': Decimal('55000.00')})
+
+        data = portfolio.to_dict()
+        assert data['positions_value'] == float(portfolio.positions_value) == 5500.0
+        assert data['total_value'] == float(portfolio.total_value) == 10500.0
+        assert data['unrealized_pnl'] == float(portfolio.unrealized_pnl) == 500.0
+        assert data['total_pnl'] == float(portfolio.total_pnl) == 500.0
+        assert data['total_return_pct'] == float(portfolio.total_return_pct) == 5.0
+        assert data['exposure_pct'] == float(portfolio.exposure_pct)
 
     def test_portfolio_exposure_pct(self):
         """Test portfolio exposure percentage"""
@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the web tests
+"""
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope='session')
+def app():
+    """The dashboard FastAPI app"""
+    from src.web.api import app
+    return app
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    """
+    One TestClient (and app startup/shutdown) for the whole session
+
+    Only WebSocket tests need it; plain HTTP tests use http_client.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+async def http_client(app):
+    """Async HTTP client calling the app in-process, without a portal thread"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as http_client:
+        yield http_client
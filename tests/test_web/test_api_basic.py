@@ -1,6 +1,5 @@
 """Basic API import tests"""
 import pytest
-from fastapi.testclient import TestClient
 
 
 def test_fastapi_imports():
@@ -13,17 +12,14 @@ def test_fastapi_imports():
         pytest.fail(f"Failed to import FastAPI: {e}")
 
 
-def test_app_creation():
+def test_app_creation(app):
     """Test FastAPI app can be created"""
-    from src.web.api import app
     assert app is not None
     assert app.title == "Icarus Trading System Dashboard"
 
 
-def test_root_endpoint():
+async def test_root_endpoint(http_client):
     """Test root endpoint returns status"""
-    from src.web.api import app
-    client = TestClient(app)
-    response = client.get("/")
+    response = await http_client.get("/")
     assert response.status_code == 200
     assert response.json()["status"] == "running"
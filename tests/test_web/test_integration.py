@@ -1,24 +1,22 @@
 """Test integration with main application"""
-import pytest
 import asyncio
-from unittest.mock import patch, AsyncMock
 
 
-@pytest.mark.asyncio
-async def test_web_server_starts():
+def test_web_server_starts(app):
     """Test that web server can start"""
-    from src.web.api import app
     assert app is not None
 
 
-@pytest.mark.asyncio
-async def test_startup_shutdown_events():
+def test_startup_shutdown_events():
     """Test app lifecycle events"""
     from src.web.api import startup, shutdown
 
-    # Should not raise exceptions
-    await startup()
-    await shutdown()
+    async def startup_then_shutdown():
+        await startup()
+        await shutdown()
+
+    # Should not raise exceptions; both hooks share one event loop
+    asyncio.run(startup_then_shutdown())
 
 
 def test_web_server_module():
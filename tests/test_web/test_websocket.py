@@ -1,27 +1,36 @@
 """Test WebSocket functionality"""
-import pytest
-import asyncio
-from fastapi.testclient import TestClient
+import json
 
 
-def test_websocket_connection():
+def test_websocket_connection(client):
     """Test WebSocket connection can be established"""
-    from src.web.api import app
-    client = TestClient(app)
-
     with client.websocket_connect("/ws") as websocket:
         # Connection should be accepted
         assert websocket is not None
 
 
-def test_websocket_disconnect():
+def test_websocket_disconnect(client):
     """Test WebSocket handles disconnect gracefully"""
-    from src.web.api import app
-    client = TestClient(app)
-
     # Connect and disconnect
     with client.websocket_connect("/ws") as websocket:
         pass  # Auto-disconnects after context
 
     # Should not raise exception
     assert True
+
+
+def test_encode_message_matches_stdlib_json():
+    """Test WebSocket messages decode to the same payload as send_json"""
+    from decimal import Decimal
+    from src.models.events import MarketTickEvent
+    from src.web.api import _encode_message
+
+    message = {
+        'type': 'market',
+        'data': MarketTickEvent(symbol='BTCUSDT', price=Decimal('50000.5')).to_dict(),
+        'timestamp': '2024-01-01T00:00:00'
+    }
+
+    text = _encode_message(message)
+    assert isinstance(text, str)
+    assert json.loads(text) == json.loads(json.dumps(message))